@@ -7,8 +7,8 @@ import asyncio
 import time
 import threading
 import json
-from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from dataclasses import dataclass, replace
 from collections import deque
 from pathlib import Path
 
@@ -54,6 +54,7 @@ class AnimationEngine:
         
         self.master_brightness = EngineSettings.ANIMATION.master_brightness
         self.speed_percent = 100
+        self._default_led_count = EngineSettings.ANIMATION.led_count
         
         self.engine_start_time = 0.0
         self.frame_count = 0
@@ -63,7 +64,9 @@ class AnimationEngine:
         self.fps_calculation_time = 0.0
         self.fps_frame_count = 0
         
-        self.state_callbacks: List[Callable] = []
+        self.state_callbacks: Tuple[Callable, ...] = ()
+        self._last_led_colors: List[List[int]] = []
+        self._frame_error_count = 0
         self._lock = threading.RLock()
         
         self.animation_running = False
@@ -72,7 +75,7 @@ class AnimationEngine:
         self.animation_paused = False
         self.pause_lock = threading.RLock()
         
-        self.stats.total_leds = EngineSettings.ANIMATION.led_count
+        self.stats.total_leds = self._default_led_count
         self.stats.target_fps = self.target_fps
         self.stats.master_brightness = self.master_brightness
         self.stats.speed_percent = self.speed_percent
@@ -85,11 +88,7 @@ class AnimationEngine:
        
     def get_current_led_count(self) -> int:
         """Get current LED count from active scene"""
-        try:
-            scene_info = self.scene_manager.get_scene_info()
-            return scene_info.get('led_count', EngineSettings.ANIMATION.led_count)
-        except Exception:
-            return EngineSettings.ANIMATION.led_count
+        return self.scene_manager.get_current_led_count() or self._default_led_count
     
     def _setup_osc_handlers(self):
         """Setup OSC message handlers for dual pattern dissolve system"""
@@ -123,7 +122,7 @@ class AnimationEngine:
             
             file_path = str(args[0])
             
-            if not file_path.lower().endswith('.json'):
+            if not Path(file_path).suffix and not Path(file_path).is_dir():
                 file_path += '.json'
                 LoggingUtils.log_info("Animation", f"Appended .json extension: {file_path}")
             
@@ -144,7 +143,7 @@ class AnimationEngine:
                         self._stop_animation_loop()
                         LoggingUtils.log_info("Animation", "Stopped animation loop for new JSON data")
                     
-                    scenes_count = len(self.scene_manager.scenes) if hasattr(self.scene_manager, 'scenes') else None
+                    scenes_count = len(self.scene_manager.get_scene_ids())
                     LoggingUtils.log_info("Animation", f"Successfully loaded {scenes_count} scenes from {file_path}")
                     AnimationLogger.log_json_loaded("scenes", scenes_count)
                     self._notify_state_change()
@@ -176,7 +175,7 @@ class AnimationEngine:
                 scene_id = int(args[0])
                 LoggingUtils.log_info("Animation", f"Caching scene change to: {scene_id}")
                 
-                available_scenes = self.scene_manager.scenes.keys() if hasattr(self.scene_manager, 'scenes') else []
+                available_scenes = self.scene_manager.get_scene_ids()
                 if not available_scenes:
                     error_message = "No scenes are loaded"
                     LoggingUtils.log_error("Animation", error_message)
@@ -184,9 +183,10 @@ class AnimationEngine:
                     return
                 
                 if scene_id not in available_scenes:
-                    error_message = f"Scene {scene_id} not found. Available: {list(available_scenes)}"
+                    available_list = list(available_scenes)
+                    error_message = f"Scene {scene_id} not found. Available: {available_list}"
                     LoggingUtils.log_warning("Animation", error_message)
-                    OSCLogger.log_validation_failed(address, "scene_id", scene_id, f"one of {list(available_scenes)}")
+                    OSCLogger.log_validation_failed(address, "scene_id", scene_id, f"one of {available_list}")
                     return
                 
                 success = self.scene_manager.change_scene(scene_id)
@@ -307,10 +307,9 @@ class AnimationEngine:
                 current_scene = self.scene_manager.current_scene
                 if current_scene:
                     current_effect = current_scene.get_current_effect()
-                    if current_effect and hasattr(current_effect, 'segments'):
+                    if current_effect:
                         for segment in current_effect.segments.values():
-                            if hasattr(segment, 'pause_segment'):
-                                segment.pause_segment()
+                            segment.pause_segment()
                 
                 with self._lock:
                     self.stats.animation_running = False
@@ -332,10 +331,9 @@ class AnimationEngine:
                 current_scene = self.scene_manager.current_scene
                 if current_scene:
                     current_effect = current_scene.get_current_effect()
-                    if current_effect and hasattr(current_effect, 'segments'):
+                    if current_effect:
                         for segment in current_effect.segments.values():
-                            if hasattr(segment, 'resume_segment'):
-                                segment.resume_segment()
+                            segment.resume_segment()
                 
                 self.animation_paused = False
                 
@@ -429,7 +427,7 @@ class AnimationEngine:
     def handle_palette_color(self, address: str, palette_id: int, color_id: int, rgb: List[int]) -> bool:
         """Handle palette color update"""
         try:
-            LoggingUtils.log_info("Animation", f"Updating palette {palette_id}[{color_id}] = RGB({rgb[0]},{rgb[1]},{rgb[2]})")
+            logger.debug("Updating palette %s[%s] = RGB(%s)", palette_id, color_id, rgb)
             
             if palette_id < 0 or palette_id > 4:
                 LoggingUtils.log_warning("Animation", f"Invalid palette ID {palette_id} (must be 0-4)")
@@ -469,7 +467,7 @@ class AnimationEngine:
             
             current_scene.palettes[palette_id][color_id] = validated_rgb
             
-            LoggingUtils.log_info("Animation", f"Successfully updated palette {palette_id}[{color_id}] = RGB({validated_rgb[0]},{validated_rgb[1]},{validated_rgb[2]})")
+            logger.info("Successfully updated palette %s[%s] = RGB(%s,%s,%s)", palette_id, color_id, *validated_rgb)
             self._notify_state_change()
             return True
                 
@@ -549,7 +547,7 @@ class AnimationEngine:
         try:
             logger.info("Starting Animation Engine...")
             
-            self.engine_start_time = time.time()
+            self.engine_start_time = time.perf_counter()
             self.frame_count = 0
             self.last_frame_time = self.engine_start_time
             self.fps_calculation_time = self.engine_start_time
@@ -605,7 +603,7 @@ class AnimationEngine:
         Main animation loop with dual pattern support and PAUSE/RESUME
         """
         try:
-            self.last_frame_time = time.time()
+            self.last_frame_time = time.perf_counter()
             self.fps_calculation_time = self.last_frame_time
             self.fps_frame_count = 0
             
@@ -629,10 +627,11 @@ class AnimationEngine:
                     delta_time = frame_start - self.last_frame_time
                     self.last_frame_time = frame_start
                     
-                    frame_process_start = time.perf_counter()
-                    self._update_frame_with_dual_patterns(delta_time, frame_start)
+                    led_count = self.get_current_led_count()
                     
-                    frame_process_time = time.perf_counter() - frame_process_start
+                    self._update_frame_with_dual_patterns(delta_time, frame_start, led_count)
+                    
+                    frame_process_time = time.perf_counter() - frame_start
                     if frame_process_time > frame_timeout:
                         logger.warning(f"Frame processing took {frame_process_time*1000:.1f}ms (timeout: {frame_timeout*1000:.1f}ms)")
                     
@@ -640,7 +639,7 @@ class AnimationEngine:
                         self.frame_count += 1
                         self.stats.frame_count = self.frame_count
                         self.stats.animation_time = frame_start - self.engine_start_time
-                        self.stats.total_leds = self.get_current_led_count()
+                        self.stats.total_leds = led_count
                     
                     self.performance_monitor.record_frame(frame_start)
                     self.fps_frame_count += 1
@@ -649,7 +648,7 @@ class AnimationEngine:
                         instant_fps = 1.0 / delta_time
                         self.fps_history.append(instant_fps)
                        
-                        self.fps_balancer.update_led_count(self.get_current_led_count())
+                        self.fps_balancer.update_led_count(led_count)
                     
                     if self.fps_frame_count >= fps_log_interval:
                         self._log_fps_status()
@@ -684,8 +683,11 @@ class AnimationEngine:
             with self._lock:
                 self.stats.animation_running = False
     
-    def _update_frame_with_dual_patterns(self, delta_time: float, current_time: float):
-        """Update animation frame with dual pattern support - PRESERVED"""
+    def _update_frame_with_dual_patterns(self, delta_time: float, current_time: float, led_count: int):
+        """
+        Update animation frame with dual pattern support
+        current_time is the loop's frame_start, so rendering, output and frame pacing share one clock reading
+        """
         try:
             with self._lock:
                 speed_percent = self.speed_percent
@@ -695,27 +697,41 @@ class AnimationEngine:
             
             self.scene_manager.update_animation(adjusted_delta)
             
-            led_colors = self.scene_manager.get_current_led_data(self.get_current_led_count())
-            led_colors = ColorUtils.apply_colors_to_array(led_colors, master_brightness)
+            led_colors = self.scene_manager.get_current_led_data(led_count, current_time)
             
-            self.led_output.send_led_data(led_colors)
+            self.led_output.send_led_data(led_colors, current_time, master_brightness)
+            self._last_led_colors = led_colors
                 
         except Exception as e:
-            LoggingUtils.log_error("Animation", f"Error in _update_frame_with_dual_patterns: {e}")
+            self._handle_frame_error(e, led_count)
+    
+    def _handle_frame_error(self, error: Exception, led_count: int):
+        """
+        Single error boundary: errors from update_animation and rendering propagate here
+        Blacks out the output and logs the first error, then every 600th
+        """
+        self._frame_error_count += 1
+        self.led_output.send_led_data(ColorUtils.get_black_frame(led_count))
+        
+        if self._frame_error_count % 600 == 1:
+            LoggingUtils.log_error("Animation", f"Error in _update_frame_with_dual_patterns ({self._frame_error_count} total): {error}")
             import traceback
             LoggingUtils.log_error("Animation", f"Traceback: {traceback.format_exc()}")
     
     def _check_scenes_available(self) -> bool:
-        """Check if scenes are available for animation"""
-        try:
-            scene_info = self.scene_manager.get_scene_info()
-            return scene_info.get('scene_id') is not None
-        except Exception:
-            return False
+        """
+        Check if scenes are available for animation
+        Called every frame - plain attribute read, no scene info dict or lock
+        """
+        return self.scene_manager.current_scene_id is not None
     
     def _log_fps_status(self):
-        """Log FPS status"""
+        """Log FPS status and refresh periodic stats"""
         try:
+            active_leds = ColorUtils.count_active_leds(self._last_led_colors) if self.master_brightness > 0 else 0
+            with self._lock:
+                self.stats.active_leds = active_leds
+            
             if self.fps_history:
                 current_fps = sum(self.fps_history) / len(self.fps_history)
                 with self._lock:
@@ -813,9 +829,18 @@ class AnimationEngine:
     
     # ==================== PRESERVED Utility Methods ====================
 
+    def add_state_callback(self, callback: Callable):
+        """Add callback for engine state changes - copy-on-write so notification needs no lock"""
+        with self._lock:
+            self.state_callbacks = self.state_callbacks + (callback,)
+    
     def _notify_state_change(self):
-        """Notify state change callbacks"""
-        for callback in self.state_callbacks:
+        """Notify state change callbacks - iterates the immutable callback tuple"""
+        callbacks = self.state_callbacks
+        if not callbacks:
+            return
+        
+        for callback in callbacks:
             try:
                 callback()
             except Exception as e:
@@ -826,16 +851,10 @@ class AnimationEngine:
         return self.scene_manager.get_scene_info()
     
     def get_stats(self) -> EngineStats:
-        """Get current engine statistics"""
+        """Get a point-in-time copy of engine statistics"""
         with self._lock:
-            stats = EngineStats()
-            stats.animation_time = self.stats.animation_time
-            stats.frame_count = self.stats.frame_count
-            stats.actual_fps = self.stats.actual_fps
-            stats.target_fps = self.stats.target_fps
-            stats.total_leds = self.stats.total_leds
-            stats.master_brightness = self.stats.master_brightness
-            stats.speed_percent = self.stats.speed_percent
-            stats.animation_running = self.stats.animation_running and not self.animation_paused
-            return stats
+            return replace(
+                self.stats,
+                animation_running=self.stats.animation_running and not self.animation_paused
+            )
   
\ No newline at end of file
@@ -8,15 +8,25 @@ import time
 import threading
 from typing import List, Dict, Any, Optional
 from pythonosc import udp_client
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
 from collections import deque
 
 from config.settings import EngineSettings
 from src.utils.logger import ComponentLogger
+from src.utils.color_utils import ColorUtils
 from src.utils.performance import ProfileTimer
 
 logger = ComponentLogger("LEDOutput")
 
 
+def _build_led_message(address: str, data: bytes) -> OscMessage:
+    """Encode LED data as an OSC blob message, ready to send to any number of destinations"""
+    builder = OscMessageBuilder(address=address)
+    builder.add_arg(data, OscMessageBuilder.ARG_TYPE_BLOB)
+    return builder.build()
+
+
 class LEDDestination:
     """
     Individual LED output destination
@@ -50,17 +60,31 @@ class LEDDestination:
             self.connection_status = "error"
             logger.error(f"Failed to create LED client {self.index}: {e}")
     
-    def send_data(self, address: str, data: bytes) -> bool:
-        """Send LED data to this destination"""
+    def send_data(self, address: str, data: bytes, current_time: Optional[float] = None) -> bool:
+        """Send LED data to this destination, stamping current_time (or now) as the send time"""
+        if not self.enabled or not self.client:
+            return False
+        
+        try:
+            message = _build_led_message(address, data)
+        except Exception as e:
+            self.error_count += 1
+            logger.error(f"Error encoding data for destination {self.index}: {e}")
+            return False
+        
+        return self.send_message(message, current_time)
+    
+    def send_message(self, message: OscMessage, current_time: Optional[float] = None) -> bool:
+        """Send an already encoded OSC message, so one encoded frame can go to several destinations"""
         if not self.enabled or not self.client:
             return False
         
         try:
             with self.performance_timer:
-                self.client.send_message(address, data)
+                self.client.send(message)
                 
             self.send_count += 1
-            self.last_send_time = time.time()
+            self.last_send_time = current_time if current_time is not None else time.perf_counter()
             self.connection_status = "active"
             return True
             
@@ -118,6 +142,11 @@ class LEDOutput:
         self.broadcast_timer = ProfileTimer("broadcast")
         
         self._lock = threading.RLock()
+        self._binary_buffer = bytearray()
+        
+        self._output_address = ""
+        self._destination_configs: List[Any] = []
+        self.refresh_settings()
         
         self.stats = {
             'total_sends': 0,
@@ -128,6 +157,17 @@ class LEDOutput:
             'last_data_size': 0
         }
         
+    def refresh_settings(self):
+        """
+        Re-read output settings used on every send
+        Called on init and start; call again after changing OSC or destination settings
+        """
+        try:
+            self._output_address = EngineSettings.OSC.output_address
+            self._destination_configs = list(EngineSettings.get_led_destinations() or [])
+        except Exception as e:
+            logger.error(f"Error reading LED output settings: {e}")
+    
     async def start(self):
         """
         Initialize LED output destinations
@@ -135,8 +175,9 @@ class LEDOutput:
         try:
             logger.info("Starting LED Output system...")
             
+            self.refresh_settings()
             self.destinations.clear()
-            destinations_config = EngineSettings.get_led_destinations()
+            destinations_config = self._destination_configs
             
             if not destinations_config:
                 logger.warning("No LED serial outputs configured")
@@ -166,7 +207,7 @@ class LEDOutput:
                 except Exception as e:
                     logger.error(f"Error creating destination {i}: {e}")
                     
-            self.fps_start_time = time.time()
+            self.fps_start_time = time.perf_counter()
             self.fps_frame_count = 0
             
             with self._lock:
@@ -200,26 +241,32 @@ class LEDOutput:
         final_stats = self.get_stats()
         logger.info(f"LED Output stopped - Total sends: {final_stats['send_count']}, Errors: {final_stats['error_count']}")
     
-    def send_led_data(self, led_colors: List[List[int]]):
+    def send_led_data(self, led_colors: List[List[int]], current_time: Optional[float] = None,
+                      master_brightness: int = 255):
         """
         Send LED color data to all active destinations
+        current_time lets the animation loop share one time.perf_counter() reading per frame
+        master_brightness is applied to the packed bytes, fused into binary conversion
         """
         if not self.output_enabled or not led_colors:
             return
         
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.perf_counter()
         
         try:
             with self._lock:
                 with self.data_conversion_timer:
                     binary_data = self._convert_to_binary(led_colors)
+                    if binary_data and master_brightness < 255:
+                        binary_data = binary_data.translate(ColorUtils.get_fade_bytes(master_brightness))
                 
                 if not binary_data:
                     logger.warning("Failed to convert LED data to binary")
                     return
                 
                 with self.broadcast_timer:
-                    successful_sends = self._broadcast_data(binary_data)
+                    successful_sends = self._broadcast_data(binary_data, current_time)
                 
                 self._update_statistics(current_time, len(binary_data), successful_sends)
                 
@@ -234,23 +281,33 @@ class LEDOutput:
     
     def _convert_to_binary(self, led_colors: List[List[int]]) -> bytes:
         """
-        Convert LED colors to optimized binary format
+        Convert LED colors to optimized binary format (R, G, B, 0 per LED)
+        Channels are written as strided slices into a reused contiguous buffer;
+        frames with out-of-range or non-int values fall back to per-LED clamping
         """
         try:
             if not led_colors:
                 return b""
             
-            binary_data = bytearray()
+            size = len(led_colors) * 4
+            binary_data = self._binary_buffer
+            if len(binary_data) != size:
+                binary_data = self._binary_buffer = bytearray(size)
             
-            for color in led_colors:
-                if len(color) >= 3:
-                    r = max(0, min(255, int(color[0])))
-                    g = max(0, min(255, int(color[1])))
-                    b = max(0, min(255, int(color[2])))
-                else:
-                    r = g = b = 0
-                
-                binary_data.extend(struct.pack("BBBB", r, g, b, 0))
+            try:
+                binary_data[0::4] = bytes([color[0] for color in led_colors])
+                binary_data[1::4] = bytes([color[1] for color in led_colors])
+                binary_data[2::4] = bytes([color[2] for color in led_colors])
+            except (ValueError, TypeError, IndexError):
+                for led_index, color in enumerate(led_colors):
+                    if len(color) >= 3:
+                        r = max(0, min(255, int(color[0])))
+                        g = max(0, min(255, int(color[1])))
+                        b = max(0, min(255, int(color[2])))
+                    else:
+                        r = g = b = 0
+                    
+                    struct.pack_into("BBBB", binary_data, led_index * 4, r, g, b, 0)
             
             return bytes(binary_data)
             
@@ -258,12 +315,15 @@ class LEDOutput:
             logger.error(f"Error converting LED data to binary: {e}")
             return b""
     
-    def _broadcast_data(self, binary_data: bytes) -> int:
+    def _broadcast_data(self, binary_data: bytes, current_time: Optional[float] = None) -> int:
         """
         Broadcast data to all active destinations with range mode support
+        All destinations share the caller's frame timestamp
+        The full frame is OSC-encoded once and the same datagram sent to every destination that takes it
         """
         successful_sends = 0
-        output_address = EngineSettings.OSC.output_address
+        output_address = self._output_address
+        full_message = None
         
         led_count = len(binary_data) // 4
         
@@ -283,20 +343,24 @@ class LEDOutput:
                         dest_config.start_led, dest_config.end_led
                     )
             
-            if destination.send_data(output_address, data_to_send):
+            if data_to_send is binary_data:
+                if full_message is None:
+                    full_message = _build_led_message(output_address, binary_data)
+                message = full_message
+            else:
+                message = _build_led_message(output_address, data_to_send)
+            
+            if destination.send_message(message, current_time):
                 successful_sends += 1
         
         return successful_sends
     
     def _get_destination_config(self, dest_index: int):
-        """Get destination configuration from settings"""
-        try:
-            destinations_config = EngineSettings.get_led_destinations()
-            if dest_index < len(destinations_config):
-                return destinations_config[dest_index]
-            return None
-        except Exception:
-            return None
+        """Get destination configuration cached by refresh_settings"""
+        destinations_config = self._destination_configs
+        if 0 <= dest_index < len(destinations_config):
+            return destinations_config[dest_index]
+        return None
     
     def _extract_led_range(self, binary_data: bytes, led_count: int, start_led: int, end_led: int) -> bytes:
         """Extract LED range with enhanced safety for large arrays"""
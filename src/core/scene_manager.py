@@ -3,19 +3,54 @@ SceneManager implementation with pattern dissolve crossfade support
 Handles scene/effect/palette changes 
 """
 
-import json
+import os
 import time
+import queue
+import logging
+import functools
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple, Iterator
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from ..models.scene import Scene
-from ..models.common import DissolveTransition, DualPatternCalculator, PatternState
+from ..models.effect import Effect
+from ..models.types import DEFAULT_LED_COUNT
+from ..models.common import DissolveTransition, DualPatternCalculator, PatternState, RenderState, SceneStats
 from ..utils.logging import LoggingUtils
+from ..utils.color_utils import ColorUtils
 from ..utils.dissolve_pattern import DissolvePatternManager
+from ..utils.json_utils import parse_json
 
 logger = LoggingUtils._get_logger("SceneManager")
 
+# Files smaller than this are parsed whole (and cached); larger ones are streamed with ijson
+_STREAM_MIN_BYTES = 1 << 20
+
+# Notifications arriving within one 60 FPS frame of each other are delivered once
+_NOTIFY_COALESCE_SECONDS = 1 / 60
+
+
+@functools.lru_cache(maxsize=1024)
+def _pattern_state(scene_id: int, effect_id: int, palette_id: int) -> PatternState:
+    """Interned PatternState - patterns are immutable, so repeat transitions share one instance"""
+    return PatternState(scene_id=scene_id, effect_id=effect_id, palette_id=palette_id)
+
+
+def _safe_callback(callback: Callable) -> Callable[[], None]:
+    """Wrap a change callback once so dispatch needs no per-call try/except"""
+    def dispatch():
+        try:
+            callback()
+        except Exception as e:
+            logger.error("Error in change callback: %s", e)
+    
+    return dispatch
+
 
 class SceneManager:
     """
@@ -25,11 +60,16 @@ class SceneManager:
     
     def __init__(self):
         self.scenes: Dict[int, Scene] = {}
+        self._scene_sources: Dict[int, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        self._sorted_scene_ids: Tuple[int, ...] = ()
         self.current_scene_id: Optional[int] = None
         self.current_scene: Optional[Scene] = None
+        self._current_led_count = 0
         
         self._lock = threading.RLock()
-        self._change_callbacks: List[Callable] = []
+        self._change_callbacks: Tuple[Callable, ...] = ()
+        self._notify_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._notify_thread: Optional[threading.Thread] = None
         
         self.dissolve_patterns = DissolvePatternManager()
         self.dissolve_transition = DissolveTransition()
@@ -38,8 +78,10 @@ class SceneManager:
         self.dissolve_transition.set_calculator(self.dual_calculator)
     
         self.current_speed_percent = 100
+        self._inv_speed_multiplier = 1.0
         
-        self.original_scene_speeds: Dict[int, Dict[str, Dict[str, float]]] = {}
+        self.original_scene_speeds: Dict[int, Dict[int, Dict[str, float]]] = {}
+        self._applied_speed_percent: Dict[int, int] = {}
         
         self.cached_scene_id: Optional[int] = None
         self.cached_effect_id: Optional[int] = None
@@ -47,32 +89,105 @@ class SceneManager:
         self.has_pending_changes = False
         self.is_initial = True
         
-        self.stats = {
-            'scenes_loaded': 0,
-            'scene_switches': 0,
-            'effect_changes': 0,
-            'palette_changes': 0,
-            'pattern_changes': 0, 
-            'dissolve_transitions_completed': 0,
-            'errors': 0
-        }
+        self._render_state = RenderState()
+        self._tick: Callable[[float], None] = self._tick_steady
+        self._dissolve_effects: Tuple[Optional[Dict[int, Scene]], Any, Tuple[Effect, ...]] = (None, None, ())
+        self._state_version = 0
+        self._scene_info_cache: Tuple[int, Dict[str, Any]] = (-1, {})
+        self._scene_snapshot: Tuple[Optional[int], Optional[Scene]] = (None, None)
+        self._led_buffer: List[List[int]] = []
+        
+        self._file_cache: Tuple[Optional[str], int, int, Any] = (None, 0, 0, None)
+        
+        self.stats = SceneStats()
     
     async def initialize(self):
         """Initialize the scene manager"""
         logger.info("Initializing Scene Manager...")
     
     def add_change_callback(self, callback: Callable):
-        """Add callback for scene changes"""
+        """Add callback for scene changes - called from the notification worker thread"""
         with self._lock:
-            self._change_callbacks.append(callback)
+            self._change_callbacks = self._change_callbacks + (_safe_callback(callback),)
+            
+            if self._notify_thread is None:
+                self._notify_thread = threading.Thread(
+                    target=self._drain_notifications, name="SceneNotify", daemon=True
+                )
+                self._notify_thread.start()
+    
+    def _set_current_scene(self, scene_id: int):
+        """
+        Switch current scene and refresh values read lock-free by the animation loop
+        _scene_snapshot pairs the ID with its scene in one store, so lock-free readers never see them mismatched
+        """
+        scene = self.scenes[scene_id]
+        self.current_scene_id = scene_id
+        self.current_scene = scene
+        self._scene_snapshot = (scene_id, scene)
+        self._current_led_count = scene.led_count
+    
+    def get_current_led_count(self) -> int:
+        """
+        Get LED count of current scene (0 when no scene is loaded)
+        Called every frame - plain attribute read, no lock needed
+        """
+        return self._current_led_count
+    
+    def _publish_render_state(self):
+        """Rebuild the render snapshot and bump the state version - call under lock"""
+        self._state_version += 1
+        
+        if not self.current_scene:
+            self._render_state = RenderState()
+            return
+        
+        if self.is_initial:
+            self._render_state = RenderState(has_scene=True)
+            return
+        
+        if self.has_pending_changes and self.cached_scene_id is not None:
+            scene = self.scenes.get(self.cached_scene_id)
+            effect_id = self.cached_effect_id if self.cached_effect_id is not None else 0
+            palette_id = self.cached_palette_id if self.cached_palette_id is not None else 0
+        else:
+            scene = self.current_scene
+            effect_id = scene.current_effect_id
+            palette_id = scene.current_palette_id
+        
+        effect = None
+        palette = None
+        if scene is not None and effect_id < len(scene.effects):
+            effect = scene.effects[effect_id]
+            if palette_id < len(scene.palettes):
+                palette = scene.palettes[palette_id]
+            else:
+                palette = [[255, 255, 255]] * 6
+        
+        self._render_state = RenderState(has_scene=True, effect=effect, palette=palette)
     
     def _notify_changes(self):
-        """Notify all registered callbacks of scene changes"""
-        for callback in self._change_callbacks:
+        """
+        Queue a change notification for the worker thread
+        Never blocks the caller; bursts of changes are coalesced into one delivery
+        """
+        if self._change_callbacks:
+            self._notify_queue.put_nowait(None)
+    
+    def _drain_notifications(self):
+        """Notification worker loop - delivers coalesced change notifications to callbacks"""
+        while True:
+            self._notify_queue.get()
+            time.sleep(_NOTIFY_COALESCE_SECONDS)
+            
             try:
-                callback()
-            except Exception as e:
-                logger.error(f"Error in change callback: {e}")
+                while True:
+                    self._notify_queue.get_nowait()
+            except queue.Empty:
+                pass
+            
+            for dispatch in self._change_callbacks:
+                dispatch()
     
     # ==================== Cache Management ====================
     
@@ -109,7 +224,7 @@ class SceneManager:
             effect_changed = self.cached_effect_id != self.current_scene.current_effect_id
             palette_changed = self.cached_palette_id != self.current_scene.current_palette_id
             
-            logger.info(f"Change detection: scene={scene_changed}, effect={effect_changed}, palette={palette_changed}")
+            logger.info("Change detection: scene=%s, effect=%s, palette=%s", scene_changed, effect_changed, palette_changed)
             
             return scene_changed or effect_changed or palette_changed
     
@@ -120,11 +235,7 @@ class SceneManager:
             self.cached_palette_id is None):
             return None
         
-        return PatternState(
-            scene_id=self.cached_scene_id,
-            effect_id=self.cached_effect_id,
-            palette_id=self.cached_palette_id
-        )
+        return _pattern_state(self.cached_scene_id, self.cached_effect_id, self.cached_palette_id)
     
     def _clear_cache(self):
         """Clear the pattern change cache"""
@@ -133,6 +244,7 @@ class SceneManager:
             self.cached_effect_id = None
             self.cached_palette_id = None
             self.has_pending_changes = False
+            self._publish_render_state()
     
     def get_cache_status(self) -> Dict[str, Any]:
         """Get cache system status"""
@@ -160,47 +272,52 @@ class SceneManager:
             with self._lock:
                 if self.dissolve_patterns.current_pattern_id is None:
                     logger.info("No dissolve pattern loaded - changes applied without transition")
-                    if self.has_pending_changes:
-                        self._clear_cache()
-                        self._notify_changes()
-                        self.stats['pattern_changes'] += 1
-                        self.is_initial = False
-                    return True
-                
-                if not self.has_pending_changes:
-                    return True
-                
-                if not self._has_pattern_changes():
-                    self._clear_cache()
-                    return True
-                
-                old_pattern = self._create_cached_pattern_state()
-                if not old_pattern:
-                    logger.warning("Cannot create old pattern state from cache")
+                    if not self.has_pending_changes:
+                        return True
+                    
                     self._clear_cache()
-                    return False
-                
-                new_pattern = self._create_current_pattern_state()
-                if not new_pattern:
-                    logger.warning("Cannot create current pattern state")
+                    self.stats.pattern_changes += 1
+                    self.is_initial = False
+                    self._publish_render_state()
+                    transition_type = None
+                else:
+                    if not self.has_pending_changes:
+                        return True
+                    
+                    if not self._has_pattern_changes():
+                        self._clear_cache()
+                        return True
+                    
+                    old_pattern = self._create_cached_pattern_state()
+                    if not old_pattern:
+                        logger.warning("Cannot create old pattern state from cache")
+                        self._clear_cache()
+                        return False
+                    
+                    new_pattern = self._create_current_pattern_state()
+                    if not new_pattern:
+                        logger.warning("Cannot create current pattern state")
+                        self._clear_cache()
+                        return False
+                    
+                    transition_type = self._determine_transition_type(old_pattern, new_pattern)
+                    
+                    self._execute_cached_dissolve(old_pattern, new_pattern, transition_type)
+                    
                     self._clear_cache()
-                    return False
-                
-                transition_type = self._determine_transition_type(old_pattern, new_pattern)
-                
-                self._execute_cached_dissolve(old_pattern, new_pattern, transition_type)
-                
-                self._clear_cache()
-                self._notify_changes()
-                self.stats['pattern_changes'] += 1
-                self.is_initial = False
-                
-                logger.info(f"Pattern change executed: {transition_type} transition with dissolve")
-                return True
+                    self.stats.pattern_changes += 1
+                    self.is_initial = False
+                    self._publish_render_state()
+            
+            self._notify_changes()
+            
+            if transition_type:
+                logger.info("Pattern change executed: %s transition with dissolve", transition_type)
+            return True
                 
         except Exception as e:
-            logger.error(f"Error executing pattern change: {e}")
-            self.stats['errors'] += 1
+            logger.error("Error executing pattern change: %s", e)
+            self.stats.errors += 1
             self._clear_cache()
             return False
     
@@ -220,7 +337,7 @@ class SceneManager:
         if self.dissolve_patterns.current_pattern_id is not None:
             pattern = self.dissolve_patterns.get_pattern(self.dissolve_patterns.current_pattern_id)
             if pattern:
-                led_count = self.current_scene.led_count if self.current_scene else 225
+                led_count = self.current_scene.led_count if self.current_scene else DEFAULT_LED_COUNT
                 
                 if transition_type == "scene":
                     self._restore_original_speeds(new_pattern.scene_id)
@@ -231,143 +348,163 @@ class SceneManager:
                     pattern,
                     led_count
                 )
+                self._tick = self._tick_dissolve
                 
-                logger.info(f"Dissolve started: {old_pattern.scene_id}.{old_pattern.effect_id}.{old_pattern.palette_id} → {new_pattern.scene_id}.{new_pattern.effect_id}.{new_pattern.palette_id}")
+                logger.info("Dissolve started: %s.%s.%s → %s.%s.%s",
+                            old_pattern.scene_id, old_pattern.effect_id, old_pattern.palette_id,
+                            new_pattern.scene_id, new_pattern.effect_id, new_pattern.palette_id)
     
     # ==================== MODIFIED Scene Operations (Cache Only) ====================
     
     def change_scene(self, scene_id: int) -> bool:
         """
-        MODIFIED: Change scene - NO automatic dissolve trigger
+        Change scene without triggering a dissolve
         Only caches change, waits for change_pattern to execute dissolve
         """
+        if scene_id == self.current_scene_id:
+            return True
+        
+        if self._materialize_scene(scene_id) is None:
+            logger.warning("Scene %s not found. Available: %s", scene_id, self._sorted_scene_ids)
+            return False
+        
+        with self._lock:
+            if scene_id not in self.scenes:
+                logger.warning("Scene %s was removed by a reload. Available: %s", scene_id, self._sorted_scene_ids)
+                return False
+            
+            if not self.has_pending_changes:
+                self._cache_current_state()
+                self.has_pending_changes = True
+            
+            old_scene_id = self.current_scene_id
+            
+            self._set_current_scene(scene_id)
+            
+            self.stats.scene_switches += 1
+            self._publish_render_state()
+        
         try:
-            with self._lock:
-                if scene_id not in self.scenes:
-                    available_scenes = list(self.scenes.keys())
-                    logger.warning(f"Scene {scene_id} not found. Available: {available_scenes}")
-                    return False
-                
-                if not self.has_pending_changes:
-                    self._cache_current_state()
-                    self.has_pending_changes = True
-                
-                old_scene_id = self.current_scene_id
-                
-                self.current_scene_id = scene_id
-                self.current_scene = self.scenes[scene_id]
-                
-                logger.info(f"Scene cached: {old_scene_id}→{scene_id} (waiting for change_pattern)")
-                
-                self.stats['scene_switches'] += 1
-                self._log_scene_status()
-                
-                return True
-                
+            logger.info("Scene cached: %s→%s (waiting for change_pattern)", old_scene_id, scene_id)
+            self._log_scene_status()
         except Exception as e:
-            logger.error(f"Error caching scene change: {e}")
-            self.stats['errors'] += 1
-            return False
+            logger.error("Error logging scene change: %s", e)
+            self.stats.errors += 1
+        
+        return True
     
     def change_effect(self, effect_id: int) -> bool:
         """
+        Change effect of the current scene
         Only caches change, waits for change_pattern to execute dissolve
         """
+        scene = self.current_scene
+        if scene is not None and scene.current_effect_id == effect_id:
+            return True
+        
+        with self._lock:
+            scene = self.current_scene
+            if not scene:
+                logger.warning("No active scene for effect change")
+                return False
+            
+            if not 0 <= effect_id < len(scene.effects):
+                logger.warning("Effect %s not found. Available: 0-%s", effect_id, len(scene.effects) - 1)
+                return False
+            
+            if not self.has_pending_changes:
+                self._cache_current_state()
+                self.has_pending_changes = True
+            
+            old_effect_id = scene.current_effect_id
+            scene.current_effect_id = effect_id
+            
+            self.stats.effect_changes += 1
+            self._publish_render_state()
+        
         try:
-            with self._lock:
-                if not self.current_scene:
-                    logger.warning("No active scene for effect change")
-                    return False
-                
-                available_effects = list(range(len(self.current_scene.effects)))
-                if effect_id < 0 or effect_id >= len(self.current_scene.effects):
-                    logger.warning(f"Effect ID {effect_id} invalid. Available effects: {available_effects}")
-                    return False
-                
-                if not self.has_pending_changes:
-                    self._cache_current_state()
-                    self.has_pending_changes = True
-                
-                old_effect_id = self.current_scene.current_effect_id
-                
-                self.current_scene.current_effect_id = effect_id
-                
-                logger.info(f"Effect cached: {old_effect_id}→{effect_id}")
-                
-                self.stats['effect_changes'] += 1
-                self._log_scene_status()
-                
-                return True
-                
+            logger.info("Effect cached: %s→%s (waiting for change_pattern)", old_effect_id, effect_id)
+            self._log_scene_status()
         except Exception as e:
-            logger.error(f"Error caching effect change: {e}")
-            self.stats['errors'] += 1
-            return False
+            logger.error("Error logging effect change: %s", e)
+            self.stats.errors += 1
+        
+        return True
     
     def change_palette(self, palette_id: int) -> bool:
         """
-        MODIFIED: Change palette - NO automatic dissolve trigger
+        Change palette of the current scene
         Only caches change, waits for change_pattern to execute dissolve
         """
+        scene = self.current_scene
+        if scene is not None and scene.current_palette_id == palette_id:
+            return True
+        
+        with self._lock:
+            scene = self.current_scene
+            if not scene:
+                logger.warning("No active scene for palette change")
+                return False
+            
+            if not 0 <= palette_id < len(scene.palettes):
+                logger.warning("Palette %s not found. Available: 0-%s", palette_id, len(scene.palettes) - 1)
+                return False
+            
+            if not self.has_pending_changes:
+                self._cache_current_state()
+                self.has_pending_changes = True
+            
+            old_palette_id = scene.current_palette_id
+            scene.current_palette_id = palette_id
+            
+            self.stats.palette_changes += 1
+            self._publish_render_state()
+        
         try:
-            with self._lock:
-                if not self.current_scene:
-                    logger.warning("No active scene for palette change")
-                    return False
-                
-                if palette_id >= len(self.current_scene.palettes):
-                    available_palettes = list(range(len(self.current_scene.palettes)))
-                    logger.warning(f"Palette {palette_id} not found. Available: {available_palettes}")
-                    return False
-                
-                if not self.has_pending_changes:
-                    self._cache_current_state()
-                    self.has_pending_changes = True
-                
-                old_palette_id = self.current_scene.current_palette_id
-                
-                self.current_scene.current_palette_id = palette_id
-                
-                logger.info(f"Palette cached: {old_palette_id}→{palette_id} (waiting for change_pattern)")
-                
-                self.stats['palette_changes'] += 1
-                self._log_scene_status()
-                
-                return True
-                
+            logger.info("Palette cached: %s→%s (waiting for change_pattern)", old_palette_id, palette_id)
+            self._log_scene_status()
         except Exception as e:
-            logger.error(f"Error caching palette change: {e}")
-            self.stats['errors'] += 1
-            return False
+            logger.error("Error logging palette change: %s", e)
+            self.stats.errors += 1
+        
+        return True
     
     # ==================== PRESERVED Methods ====================
     
     def set_speed_percent(self, speed_percent: int):
-        """Set current speed percentage and apply to current scene segments"""
+        """
+        Set current speed percentage and apply to current scene segments
+        Duplicate values (e.g. from UI sliders) leave segments untouched
+        """
         with self._lock:
             old_speed = self.current_speed_percent
             self.current_speed_percent = speed_percent
+            self._inv_speed_multiplier = 100.0 / speed_percent if speed_percent > 0 else 0.0
             
             if self.current_scene:
                 self._apply_speed_to_scene(self.current_scene_id, speed_percent)
             
-            logger.info(f"Speed changed from {old_speed}% to {speed_percent}%")
+            if old_speed != speed_percent:
+                logger.info("Speed changed from %s%% to %s%%", old_speed, speed_percent)
 
-    def _store_original_speeds(self, scene_id: int):
-        """Store original move speeds for a scene"""
+    @staticmethod
+    def _collect_original_speeds(scene: Scene) -> Dict[int, Dict[int, float]]:
+        """Snapshot segment move speeds per effect - reads only the given scene, so it needs no lock"""
+        return {
+            effect.effect_id: {segment_id: segment.move_speed for segment_id, segment in effect.segments.items()}
+            for effect in scene.effects
+        }
+    
+    def _store_original_speeds(self, scene_id: int, scene_speeds: Optional[Dict[int, Dict[int, float]]] = None):
+        """Store original move speeds for a scene, optionally from a snapshot taken before locking"""
         if scene_id not in self.scenes:
             return
-            
-        scene = self.scenes[scene_id]
-        scene_speeds = {}
         
-        for effect in scene.effects:
-            effect_speeds = {}
-            for segment_id, segment in effect.segments.items():
-                effect_speeds[segment_id] = segment.move_speed
-            scene_speeds[str(effect.effect_id)] = effect_speeds
+        if scene_speeds is None:
+            scene_speeds = self._collect_original_speeds(self.scenes[scene_id])
         
         self.original_scene_speeds[scene_id] = scene_speeds
+        self._applied_speed_percent[scene_id] = 100
     
     def _apply_speed_to_current_effect(self, scene_id: int, speed_percent: int):
         """Apply speed percentage only to current effect (used for effect changes without dissolve)"""
@@ -380,29 +517,41 @@ class SceneManager:
         
         current_effect = scene.get_current_effect()
         if current_effect:
-            effect_id_str = str(current_effect.effect_id)
-            if effect_id_str in original_speeds:
+            effect_speeds = original_speeds.get(current_effect.effect_id)
+            if effect_speeds:
                 for segment_id, segment in current_effect.segments.items():
-                    if segment_id in original_speeds[effect_id_str]:
-                        original_speed = original_speeds[effect_id_str][segment_id]
+                    original_speed = effect_speeds.get(segment_id)
+                    if original_speed is not None:
                         segment.move_speed = original_speed * speed_multiplier
 
     def _apply_speed_to_scene(self, scene_id: int, speed_percent: int):
-        """Apply speed percentage to specific scene segments (used for effect/palette changes)"""
+        """
+        Apply speed percentage to specific scene segments (used for effect/palette changes)
+        Skipped when the scene already runs at this percentage; 100% is a plain restore
+        """
         if scene_id not in self.scenes or scene_id not in self.original_scene_speeds:
             return
+        
+        if self._applied_speed_percent.get(scene_id) == speed_percent:
+            return
+        
+        if speed_percent == 100:
+            self._restore_original_speeds(scene_id)
+            return
             
         scene = self.scenes[scene_id]
         original_speeds = self.original_scene_speeds[scene_id]
         speed_multiplier = speed_percent / 100.0
         
         for effect in scene.effects:
-            effect_id_str = str(effect.effect_id)
-            if effect_id_str in original_speeds:
+            effect_speeds = original_speeds.get(effect.effect_id)
+            if effect_speeds:
                 for segment_id, segment in effect.segments.items():
-                    if segment_id in original_speeds[effect_id_str]:
-                        original_speed = original_speeds[effect_id_str][segment_id]
+                    original_speed = effect_speeds.get(segment_id)
+                    if original_speed is not None:
                         segment.move_speed = original_speed * speed_multiplier
+        
+        self._applied_speed_percent[scene_id] = speed_percent
 
     def _restore_original_speeds(self, scene_id: int):
         """Restore original move speeds for a scene (used for scene changes)"""
@@ -413,218 +562,391 @@ class SceneManager:
         original_speeds = self.original_scene_speeds[scene_id]
         
         for effect in scene.effects:
-            effect_id_str = str(effect.effect_id)
-            if effect_id_str in original_speeds:
+            effect_speeds = original_speeds.get(effect.effect_id)
+            if effect_speeds:
                 for segment_id, segment in effect.segments.items():
-                    if segment_id in original_speeds[effect_id_str]:
-                        original_speed = original_speeds[effect_id_str][segment_id]
+                    original_speed = effect_speeds.get(segment_id)
+                    if original_speed is not None:
                         segment.move_speed = original_speed
+        
+        self._applied_speed_percent[scene_id] = 100
 
     # ==================== JSON Loading ====================
     
+    def _load_json_cached(self, file_path: str) -> Any:
+        """Load JSON file, reusing the parsed data while the last loaded file is unchanged"""
+        real_path = os.path.realpath(file_path)
+        stat = os.stat(real_path)
+        file_key = (real_path, stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._file_cache
+        if cached[:3] == file_key:
+            return cached[3]
+        
+        data = parse_json(Path(real_path).read_bytes())
+        
+        self._file_cache = (*file_key, data)
+        return data
+    
+    def _iter_scene_data(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """Yield raw scene dictionaries from a multiple-scenes JSON file, streaming large files"""
+        real_path = os.path.realpath(file_path)
+        stat = os.stat(real_path)
+        cached = self._file_cache[:3] == (real_path, stat.st_mtime_ns, stat.st_size)
+        
+        if ijson is not None and not cached and stat.st_size >= _STREAM_MIN_BYTES:
+            with open(real_path, 'rb') as f:
+                yield from ijson.items(f, 'scenes.item', use_float=True)
+            return
+        
+        data = self._load_json_cached(file_path)
+        
+        scenes_data = data.get("scenes") if isinstance(data, dict) else None
+        if not isinstance(scenes_data, list):
+            raise ValueError("Invalid JSON format: expected an object with a 'scenes' array")
+        
+        yield from scenes_data
+    
     def load_multiple_scenes_from_file(self, file_path: str) -> bool:
-        """Load multiple scenes from JSON file with 'scenes' array"""
+        """
+        Load multiple scenes from JSON file with 'scenes' array
+        Parsing and Scene construction run outside the lock
+        """
         try:
+            file_path_obj = Path(file_path)
+            if not file_path_obj.exists():
+                logger.error("Scene file not found: %s", file_path)
+                return False
+            
+            if file_path_obj.is_dir() or file_path_obj.suffix == ".jsonl":
+                return self.load_scene_index(file_path)
+            
+            loaded_scenes = [Scene.from_dict(scene_data) for scene_data in self._iter_scene_data(file_path)]
+            
+            if not loaded_scenes:
+                logger.error("No valid scenes found in file")
+                return False
+            
+            loaded_speeds = [self._collect_original_speeds(scene) for scene in loaded_scenes]
+            
             with self._lock:
-                file_path_obj = Path(file_path)
-                if not file_path_obj.exists():
-                    logger.error(f"Scene file not found: {file_path}")
-                    return False
-                
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                if "scenes" not in data:
-                    logger.error("Invalid JSON format: missing 'scenes' array")
-                    return False
-                
-                scenes_data = data["scenes"]
-                if not isinstance(scenes_data, list):
-                    logger.error("Invalid JSON format: 'scenes' must be an array")
-                    return False
-                
                 self.original_scene_speeds.clear()
+                self._applied_speed_percent.clear()
                 
                 self.is_initial = True
                 self.has_pending_changes = False
                 self._clear_cache()
                 
-                scenes_loaded = 0
+                scenes = dict(self.scenes)
+                for scene in loaded_scenes:
+                    scenes[scene.scene_id] = scene
+                    self._scene_sources.pop(scene.scene_id, None)
+                self.scenes = scenes
                 
-                for scene_data in scenes_data:
-                    try:
-                        scene = Scene.from_dict(scene_data)
-                        self.scenes[scene.scene_id] = scene
-                        self._store_original_speeds(scene.scene_id)
-                        
-                        scenes_loaded += 1
-                    except Exception as e:
-                        logger.error(f"Error loading scene: {e}")
-                        continue
+                for scene, scene_speeds in zip(loaded_scenes, loaded_speeds):
+                    self._store_original_speeds(scene.scene_id, scene_speeds)
                 
-                if scenes_loaded > 0:
-                    if self.current_scene_id is None:
-                        first_scene_id = min(self.scenes.keys())
-                        self.current_scene_id = first_scene_id
-                        self.current_scene = self.scenes[first_scene_id]
-                        
-                        self._restore_original_speeds(first_scene_id)
-                    
-                    self.is_initial = False
+                self._refresh_scene_ids()
+                
+                if self.current_scene_id is None:
+                    first_scene_id = self._sorted_scene_ids[0]
+                    self._set_current_scene(first_scene_id)
                     
-                    self.stats['scenes_loaded'] += scenes_loaded
-                    logger.info(f"Available scenes: {sorted(self.scenes.keys())}")
-                    self._log_scene_status()
-                    self._notify_changes()
-                    return True
+                    self._restore_original_speeds(first_scene_id)
                 else:
-                    logger.error("No valid scenes found in file")
-                    return False
+                    self._set_current_scene(self.current_scene_id)
+                
+                self.is_initial = False
+                self._publish_render_state()
+                self.dissolve_transition.preallocate(self.current_scene.led_count)
+                
+                self.stats.scenes_loaded += len(loaded_scenes)
+            
+            logger.info("Available scenes: %s", self._sorted_scene_ids)
+            self._log_scene_status()
+            self._notify_changes()
+            return True
+                    
+        except Exception as e:
+            logger.error("Error loading scenes: %s", e)
+            self.stats.errors += 1
+            return False
+    
+    def load_scene_index(self, source_path: str) -> bool:
+        """
+        Index scenes stored one per file (directory of NNN.json) or one per line (.jsonl)
+        Scenes are built on first use
+        """
+        try:
+            sources = self._index_scene_sources(Path(source_path))
+            
+            if not sources:
+                logger.error("No valid scenes found in index")
+                return False
+            
+            while True:
+                state_version = self._state_version
+                is_first_load = self.current_scene_id is None
+                scene_id = min(self.scenes.keys() | sources.keys()) if is_first_load else self.current_scene_id
+                
+                first_scene = None
+                if scene_id in sources:
+                    first_scene = self._build_indexed_scene(scene_id, sources[scene_id])
+                    if first_scene is None:
+                        raise ValueError(f"Scene {scene_id} could not be loaded")
+                    first_speeds = self._collect_original_speeds(first_scene)
+                
+                with self._lock:
+                    if self._state_version != state_version:
+                        continue
+                    
+                    self.is_initial = True
+                    self.has_pending_changes = False
+                    self._clear_cache()
+                    
+                    scenes = {sid: scene for sid, scene in self.scenes.items() if sid not in sources}
+                    for sid in sources:
+                        self.original_scene_speeds.pop(sid, None)
+                        self._applied_speed_percent.pop(sid, None)
+                    self._scene_sources.update(sources)
+                    
+                    if first_scene is not None:
+                        scenes[scene_id] = first_scene
+                        del self._scene_sources[scene_id]
+                    self.scenes = scenes
+                    if first_scene is not None:
+                        self._store_original_speeds(scene_id, first_speeds)
                     
+                    self._refresh_scene_ids()
+                    self._set_current_scene(scene_id)
+                    if is_first_load:
+                        self._restore_original_speeds(scene_id)
+                    
+                    self.is_initial = False
+                    self._publish_render_state()
+                    self.dissolve_transition.preallocate(self.current_scene.led_count)
+                    
+                    self.stats.scenes_loaded += len(sources)
+                break
+            
+            logger.info("Indexed scenes: %s", self._sorted_scene_ids)
+            self._log_scene_status()
+            self._notify_changes()
+            return True
+        
         except Exception as e:
-            logger.error(f"Error loading scenes: {e}")
-            self.stats['errors'] += 1
+            logger.error("Error indexing scenes: %s", e)
+            self.stats.errors += 1
             return False
     
+    @staticmethod
+    def _index_scene_sources(path: Path) -> Dict[int, Tuple[str, Optional[Dict[str, Any]]]]:
+        """Map scene IDs to (file, parsed scene data or None) without building scenes"""
+        sources = {}
+        
+        if path.is_dir():
+            for scene_file in sorted(path.glob("*.json")):
+                if not scene_file.stem.isdigit():
+                    logger.warning("Skipping non-scene file: %s", scene_file.name)
+                    continue
+                sources[int(scene_file.stem)] = (str(scene_file), None)
+            return sources
+        
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    scene_data = parse_json(line)
+                    scene_id = int(scene_data.get("scene_id", scene_data.get("scene_ID", 0)))
+                    sources[scene_id] = (str(path), scene_data)
+        return sources
+    
+    def _materialize_scene(self, scene_id: int) -> Optional[Scene]:
+        """Return a loaded scene, building it from its indexed source on first access"""
+        while True:
+            scene = self.scenes.get(scene_id)
+            if scene is not None:
+                return scene
+            
+            source = self._scene_sources.get(scene_id)
+            if source is None:
+                return None
+            
+            scene = self._build_indexed_scene(scene_id, source)
+            if scene is None:
+                return None
+            scene_speeds = self._collect_original_speeds(scene)
+            
+            with self._lock:
+                if self._scene_sources.get(scene_id) is source:
+                    scenes = dict(self.scenes)
+                    scenes[scene_id] = scene
+                    self.scenes = scenes
+                    del self._scene_sources[scene_id]
+                    self._store_original_speeds(scene_id, scene_speeds)
+                    break
+        
+        logger.info("Scene %s loaded from %s", scene_id, source[0])
+        return scene
+    
+    def _build_indexed_scene(self, scene_id: int, source: Tuple[str, Optional[Dict[str, Any]]]) -> Optional[Scene]:
+        """Read and build one indexed scene without locking, logging and returning None on failure"""
+        file_path, scene_data = source
+        try:
+            if scene_data is None:
+                scene_data = parse_json(Path(file_path).read_bytes())
+            return Scene.from_dict(scene_data)
+        except (OSError, ValueError, KeyError) as e:
+            logger.error("Error loading scene %s from %s: %s", scene_id, file_path, e)
+            self.stats.errors += 1
+            return None
+    
+    def _refresh_scene_ids(self):
+        """Rebuild the sorted ID tuple from loaded and indexed scenes"""
+        self._sorted_scene_ids = tuple(sorted(self.scenes.keys() | self._scene_sources.keys()))
+    
     def _log_scene_status(self):
-        """Log current scene status"""
-        if self.current_scene:
-            current_status = f"Scene={self.current_scene_id} Effect={self.current_scene.current_effect_id} Palette={self.current_scene.current_palette_id}"
-            
-            if self.has_pending_changes:
-                cached_status = f"CACHED: Scene={self.cached_scene_id} Effect={self.cached_effect_id} Palette={self.cached_palette_id}"
-                logger.info(f"CURRENT: {current_status}")
-                logger.info(f"{cached_status} (waiting for change_pattern)")
-            else:
-                logger.info(f"STATUS: {current_status}")
+        """Log current scene status - skipped entirely when INFO is disabled"""
+        if not self.current_scene or not logger.isEnabledFor(logging.INFO):
+            return
+        
+        scene = self.current_scene
+        current_effect = scene.get_current_effect()
+        expected_leds = current_effect.get_expected_led_count() if current_effect else 0
+        
+        if self.has_pending_changes:
+            logger.info("CURRENT: Scene=%s Effect=%s Palette=%s ExpectedLEDs=%d",
+                        self.current_scene_id, scene.current_effect_id, scene.current_palette_id, expected_leds)
+            logger.info("CACHED: Scene=%s Effect=%s Palette=%s (waiting for change_pattern)",
+                        self.cached_scene_id, self.cached_effect_id, self.cached_palette_id)
+        else:
+            logger.info("STATUS: Scene=%s Effect=%s Palette=%s ExpectedLEDs=%d",
+                        self.current_scene_id, scene.current_effect_id, scene.current_palette_id, expected_leds)
+    
+    def get_scene_ids(self) -> Tuple[int, ...]:
+        """Get cached sorted scene IDs without allocating a new list"""
+        return self._sorted_scene_ids
     
     def get_scene_info(self) -> Dict[str, Any]:
-        """Get current scene information"""
-        with self._lock:
-            if not self.current_scene:
-                return {}
-            
-            return {
-                'scene_id': self.current_scene_id,
-                'led_count': self.current_scene.led_count,
-                'fps': self.current_scene.fps,
-                'current_effect_id': self.current_scene.current_effect_id,
-                'current_palette_id': self.current_scene.current_palette_id,
-                'effects_count': len(self.current_scene.effects),
-                'palettes_count': len(self.current_scene.palettes)
+        """Get current scene information, rebuilt only when the state version changes"""
+        state_version = self._state_version
+        version, info = self._scene_info_cache
+        if version == state_version:
+            return dict(info)
+        
+        scene_id, scene = self._scene_snapshot
+        if scene is None:
+            info = {}
+        else:
+            info = {
+                'scene_id': scene_id,
+                'led_count': scene.led_count,
+                'fps': scene.fps,
+                'current_effect_id': scene.current_effect_id,
+                'current_palette_id': scene.current_palette_id,
+                'effects_count': len(scene.effects),
+                'palettes_count': len(scene.palettes)
             }
+        
+        self._scene_info_cache = (state_version, info)
+        return dict(info)
     
     # ==================== Animation Update ====================
     
     def update_animation(self, delta_time: float):
         """
         Update animation for current scene and dissolve transitions
-        
+
         Logic:
         - delta_time from animation_engine is already multiplied by speed_percent
         - move_speed in segments is adjusted by speed_percent (current speed) or original (scene change fade in)
         - To avoid double speed application, always pass original delta_time to effects
         - Avoid updating same effect twice during dissolve (for palette changes)
         """
-        try:
-            with self._lock:
-                if not self.current_scene:
-                    return
+        inv_speed = self._inv_speed_multiplier
+        if delta_time <= 0 or inv_speed <= 0:
+            return
+        
+        self._tick(delta_time * inv_speed)
+    
+    def _tick_steady(self, original_delta: float):
+        """Steady-state tick: advance only the rendered effect"""
+        effect = self._render_state.effect
+        if effect is not None:
+            effect.update_animation(original_delta)
+    
+    def _tick_dissolve(self, original_delta: float):
+        """
+        Dissolve tick: advance both patterns, falling back to the steady tick once the transition ends
+        is_active is re-read after the swap so a dissolve started concurrently is never dropped
+        """
+        transition = self.dissolve_transition
+        if not transition.is_active:
+            self._tick = self._tick_steady
+            if transition.is_active:
+                self._tick = self._tick_dissolve
+            self._tick_steady(original_delta)
+            return
+        
+        self._update_dissolve_effects(original_delta)
+    
+    def _update_dissolve_effects(self, original_delta: float):
+        """Update old and new pattern effects during dissolve, once when both use the same effect"""
+        scenes = self.scenes
+        pattern_pair = self.dissolve_transition.pattern_pair
+        cached_scenes, cached_pair, effects = self._dissolve_effects
+        if cached_scenes is not scenes or cached_pair is not pattern_pair:
+            effects = self._resolve_dissolve_effects(scenes, pattern_pair)
+            self._dissolve_effects = (scenes, pattern_pair, effects)
+        
+        for effect in effects:
+            effect.update_animation(original_delta)
+    
+    @staticmethod
+    def _resolve_dissolve_effects(scenes: Dict[int, Scene],
+                                  pattern_pair: Tuple[Optional[PatternState], Optional[PatternState]]) -> Tuple[Effect, ...]:
+        """Resolve the effects a dissolve animates, ignoring patterns whose scene or effect is gone"""
+        effects: List[Effect] = []
+        for pattern in pattern_pair:
+            if pattern is None:
+                continue
             
-                if self.current_speed_percent > 0:
-                    original_delta = delta_time / (self.current_speed_percent / 100.0)
-                else:
-                    original_delta = delta_time  
-                
-                if self.dissolve_transition.is_active:
-                    updated_effects = set() 
-                    
-                    if (self.dissolve_transition.old_pattern and 
-                        self.dissolve_transition.old_pattern.scene_id in self.scenes):
-                        old_scene = self.scenes[self.dissolve_transition.old_pattern.scene_id]
-                        if self.dissolve_transition.old_pattern.effect_id < len(old_scene.effects):
-                            old_effect = old_scene.effects[self.dissolve_transition.old_pattern.effect_id]
-                            effect_key = (self.dissolve_transition.old_pattern.scene_id, self.dissolve_transition.old_pattern.effect_id)
-                            if effect_key not in updated_effects:
-                                old_effect.update_animation(original_delta)
-                                updated_effects.add(effect_key)
-                    
-                    if (self.dissolve_transition.new_pattern and 
-                        self.dissolve_transition.new_pattern.scene_id in self.scenes):
-                        new_scene = self.scenes[self.dissolve_transition.new_pattern.scene_id]
-                        if self.dissolve_transition.new_pattern.effect_id < len(new_scene.effects):
-                            new_effect = new_scene.effects[self.dissolve_transition.new_pattern.effect_id]
-                            effect_key = (self.dissolve_transition.new_pattern.scene_id, self.dissolve_transition.new_pattern.effect_id)
-                            if effect_key not in updated_effects:
-                                new_effect.update_animation(original_delta)
-                                updated_effects.add(effect_key)
-                else:
-                    if self.is_initial:
-                        pass
-                    elif self.has_pending_changes and self.cached_scene_id is not None:
-                        scene_id = self.cached_scene_id
-                        effect_id = self.cached_effect_id if self.cached_effect_id is not None else 0
-                        
-                        if scene_id in self.scenes:
-                            cached_scene = self.scenes[scene_id]
-                            if effect_id < len(cached_scene.effects):
-                                cached_scene.effects[effect_id].update_animation(original_delta)
-                    else:
-                        if self.current_scene.current_effect_id < len(self.current_scene.effects):
-                            current_effect = self.current_scene.effects[self.current_scene.current_effect_id]
-                            current_effect.update_animation(original_delta)
-                        
-        except Exception as e:
-            logger.error(f"Error updating effects animation: {e}")
+            scene = scenes.get(pattern.scene_id)
+            if scene is None or not 0 <= pattern.effect_id < len(scene.effects):
+                continue
+            
+            effect = scene.effects[pattern.effect_id]
+            if all(effect is not resolved for resolved in effects):
+                effects.append(effect)
+        return tuple(effects)
     
-    def get_current_led_data(self, led_count: int) -> List[List[int]]:
-        """Get current LED data for rendering - FIXED: Use cached values when changes are pending"""
-        try:
+    def _ensure_led_buffer(self, led_count: int) -> List[List[int]]:
+        """
+        Get the reusable render buffer, resized in place only when led_count changes
+        Effect.render_to_led_array clears it before drawing, so no per-frame zero fill is needed
+        """
+        led_buffer = self._led_buffer
+        if len(led_buffer) != led_count:
+            ColorUtils.resize_frame(led_buffer, led_count)
+        return led_buffer
+    
+    def get_current_led_data(self, led_count: int, current_time: float) -> List[List[int]]:
+        """Get current LED data for rendering - the returned frame is reused by the next call"""
+        render_state = self._render_state
+        if not render_state.has_scene:
+            return ColorUtils.get_black_frame(led_count)
+        
+        transition = self.dissolve_transition
+        if transition.is_active:
             with self._lock:
-                if not self.current_scene:
-                    return [[0, 0, 0] for _ in range(led_count)]
-                
-                current_time = time.time()
-                
-                if self.dissolve_transition.is_active:
-                    return self.dissolve_transition.update_dissolve(current_time)
-                else:
-                    led_array = [[0, 0, 0] for _ in range(led_count)]
-                    
-                    if self.is_initial:
-                        pass
-                    elif self.has_pending_changes and self.cached_scene_id is not None:
-                        scene_id = self.cached_scene_id
-                        effect_id = self.cached_effect_id if self.cached_effect_id is not None else 0
-                        palette_id = self.cached_palette_id if self.cached_palette_id is not None else 0
-                       
-                        if scene_id in self.scenes:
-                            cached_scene = self.scenes[scene_id]
-                            if effect_id < len(cached_scene.effects):
-                                effect = cached_scene.effects[effect_id]
-                                
-                                if palette_id < len(cached_scene.palettes):
-                                    palette = cached_scene.palettes[palette_id]
-                                else:
-                                    palette = [[255, 255, 255]] * 6
-                                
-                                effect.render_to_led_array(palette, current_time, led_array)
-                    else:
-                        if self.current_scene.current_effect_id < len(self.current_scene.effects):
-                            effect = self.current_scene.effects[self.current_scene.current_effect_id]
-                            
-                            if self.current_scene.current_palette_id < len(self.current_scene.palettes):
-                                palette = self.current_scene.palettes[self.current_scene.current_palette_id]
-                            else:
-                                palette = [[255, 255, 255]] * 6 
-                            
-                            effect.render_to_led_array(palette, current_time, led_array)
-                    
-                    return led_array
-                    
-        except Exception as e:
-            logger.error(f"Error getting LED data: {e}")
-            return [[0, 0, 0] for _ in range(led_count)]
+                return transition.update_dissolve(current_time)
+        
+        if render_state.effect is None:
+            return ColorUtils.get_black_frame(led_count)
+        
+        led_array = self._ensure_led_buffer(led_count)
+        render_state.effect.render_to_led_array(render_state.palette, current_time, led_array)
+        
+        return led_array
     
     # ==================== Dissolve Pattern Management ====================
     
@@ -633,43 +955,48 @@ class SceneManager:
         try:
             return self.dissolve_patterns.load_patterns_from_json(file_path)
         except Exception as e:
-            logger.error(f"Error loading dissolve patterns: {e}")
+            logger.error("Error loading dissolve patterns: %s", e)
             return False
     
     def set_dissolve_pattern(self, pattern_id: int) -> bool:
         """Set current dissolve pattern"""
         try:
-            available_patterns = self.dissolve_patterns.get_available_patterns()
-            
-            if pattern_id not in available_patterns:
-                logger.warning(f"Dissolve pattern {pattern_id} not found. Available: {available_patterns}")
+            if pattern_id not in self.dissolve_patterns.patterns:
+                logger.warning("Dissolve pattern %s not found. Available: %s",
+                               pattern_id, self.dissolve_patterns.get_pattern_ids())
                 return False
             
             success = self.dissolve_patterns.set_current_pattern(pattern_id)
             
             if success:
-                logger.info(f"Dissolve pattern set to {pattern_id}")
+                logger.info("Dissolve pattern set to %s", pattern_id)
             else:
-                logger.warning(f"Failed to set dissolve pattern {pattern_id}")
+                logger.warning("Failed to set dissolve pattern %s", pattern_id)
             
             return success
             
         except Exception as e:
-            logger.error(f"Error setting dissolve pattern: {e}")
+            logger.error("Error setting dissolve pattern: %s", e)
             return False
     
     def get_dissolve_info(self) -> Dict[str, Any]:
-        """Get dissolve system information"""
-        with self._lock:
-            available_patterns = self.dissolve_patterns.get_available_patterns()
-            return {
-                "enabled": len(available_patterns) > 0,
-                "current_pattern_id": self.dissolve_patterns.current_pattern_id,
-                "available_patterns": available_patterns,
-                "pattern_count": len(available_patterns),
-                "transition_active": self.dissolve_transition.is_active,
-                "transition_phase": self.dissolve_transition.phase.value if self.dissolve_transition.is_active else "completed"
-            }
+        """
+        Get dissolve system information
+        Lock-free: each field is a single attribute read of an immutable value
+        """
+        pattern_ids = self.dissolve_patterns.get_pattern_ids()
+        current_pattern_id = self.dissolve_patterns.current_pattern_id
+        transition_active = self.dissolve_transition.is_active
+        phase_str = self.dissolve_transition.phase_str
+        
+        return {
+            "enabled": len(pattern_ids) > 0,
+            "current_pattern_id": current_pattern_id,
+            "available_patterns": list(pattern_ids),
+            "pattern_count": len(pattern_ids),
+            "transition_active": transition_active,
+            "transition_phase": phase_str if transition_active else "completed"
+        }
     
     # ==================== Pattern Creation ====================
     
@@ -678,8 +1005,5 @@ class SceneManager:
         if not self.current_scene:
             return None
         
-        return PatternState(
-            scene_id=self.current_scene_id,
-            effect_id=self.current_scene.current_effect_id,
-            palette_id=self.current_scene.current_palette_id
-        )
\ No newline at end of file
+        return _pattern_state(self.current_scene_id, self.current_scene.current_effect_id,
+                              self.current_scene.current_palette_id)
\ No newline at end of file
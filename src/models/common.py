@@ -3,13 +3,13 @@ Common models for LED Animation Engine with Dual Pattern Dissolve System
 Handles simultaneous fade-out and fade-in of two patterns
 """
 
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple, Callable
+from dataclasses import dataclass, field, asdict
 import time
 import threading
 
 from src.utils.color_utils import ColorUtils
-from src.models.types import DissolvePhase
+from src.models.types import DissolvePhase, DEFAULT_LED_COUNT
 from src.utils.logger import ComponentLogger
 
 logger = ComponentLogger("Common")
@@ -22,7 +22,7 @@ class EngineStats:
     actual_fps: float = 0.0
     frame_count: int = 0
     active_leds: int = 0
-    total_leds: int = 225
+    total_leds: int = DEFAULT_LED_COUNT
     animation_time: float = 0.0
     master_brightness: int = 255
     speed_percent: int = 100 
@@ -31,26 +31,73 @@ class EngineStats:
     animation_running: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
+class SceneStats:
+    """Scene manager counters - slotted so increments avoid dict hashing"""
+    scenes_loaded: int = 0
+    scene_switches: int = 0
+    effect_changes: int = 0
+    palette_changes: int = 0
+    pattern_changes: int = 0
+    dissolve_transitions_completed: int = 0
+    errors: int = 0
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Get counters as a dictionary"""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
 class PatternState:
     """
     Represents a pattern state during dissolve transition
     Pattern = Effect + Palette + Scene combination
+    Immutable and hashable so equal patterns can be shared
     """
     scene_id: int
     effect_id: int
     palette_id: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class RenderState:
+    """
+    Immutable snapshot of what the render loop should draw
+    Published by SceneManager under its lock and read lock-free every frame
+    """
+    has_scene: bool = False
+    effect: Optional[Any] = None
+    palette: Optional[List[List[int]]] = None
+
+
+@dataclass(slots=True)
 class LEDCrossfadeState:
     """
     Per-LED crossfade state for dual pattern dissolve
     Each LED has independent timing and blends two patterns simultaneously
+    Slotted: one instance per LED, fields read on every dissolve frame
     """
     crossfade_start_time: float = 0.0
     crossfade_duration_ms: int = 0
     blend_progress: float = 0.0
+    crossfade_end_time: float = 0.0
+    inv_duration: float = 0.0
+
+
+@dataclass(slots=True)
+class LEDTimingRun:
+    """
+    Consecutive LEDs sharing identical crossfade timing
+    Lets the dissolve blend decide waiting/fading/done once per run instead of once per LED
+    """
+    start_idx: int
+    end_idx: int
+    crossfade_start_time: float
+    crossfade_end_time: float
+    crossfade_duration_ms: int
+    inv_duration: float
+    states: List[LEDCrossfadeState]
+    progress: float = 0.0
 
 
 @dataclass
@@ -70,47 +117,58 @@ class DualPatternCalculator:
     
     def __init__(self, scene_manager):
         self.scene_manager = scene_manager
-        self._lock = threading.RLock()
         
     def calculate_pattern_colors(self, pattern_state: PatternState, current_time: float, 
-                                led_count: int) -> List[List[int]]:
+                                led_count: int, led_array: Optional[List[List[int]]] = None) -> List[List[int]]:
         """
         Calculate LED colors for a specific pattern with animation continuing
-        
+
         Args:
             pattern_state: Pattern configuration (scene, effect, palette)
             current_time: Current timestamp for animation timing
             led_count: Number of LEDs to calculate
+            led_array: Optional reusable buffer of led_count entries, overwritten in place
             
         Returns:
             List of RGB color arrays for each LED
         """
-        try:
-            with self._lock:
-                if pattern_state.scene_id not in self.scene_manager.scenes:
-                    return [[0, 0, 0] for _ in range(led_count)]
-                
-                scene = self.scene_manager.scenes[pattern_state.scene_id]
-                
-                if pattern_state.effect_id >= len(scene.effects):
-                    return [[0, 0, 0] for _ in range(led_count)]
-                
-                effect = scene.effects[pattern_state.effect_id]
-                
-                if pattern_state.palette_id >= len(scene.palettes):
-                    palette = scene.palettes[0] if scene.palettes else [[255, 255, 255]] * 6
-                else:
-                    palette = scene.palettes[pattern_state.palette_id]
-                
-                led_array = [[0, 0, 0] for _ in range(led_count)]
-                
-                effect.render_to_led_array(palette, current_time, led_array)
-                
-                return led_array
-                
-        except Exception as e:
-            logger.error(f"Error calculating pattern colors: {e}")
-            return [[0, 0, 0] for _ in range(led_count)]
+        scene = self.scene_manager.scenes.get(pattern_state.scene_id)
+        if scene is None:
+            return ColorUtils.get_black_frame(led_count)
+        
+        if pattern_state.effect_id >= len(scene.effects):
+            return ColorUtils.get_black_frame(led_count)
+        
+        effect = scene.effects[pattern_state.effect_id]
+        
+        if pattern_state.palette_id >= len(scene.palettes):
+            palette = scene.palettes[0] if scene.palettes else [[255, 255, 255]] * 6
+        else:
+            palette = scene.palettes[pattern_state.palette_id]
+        
+        if led_array is None or len(led_array) != led_count:
+            led_array = [[0, 0, 0] for _ in range(led_count)]
+        
+        effect.render_to_led_array(palette, current_time, led_array)
+        
+        return led_array
+
+
+def _blend_rows(old_rows: List[List[int]], new_rows: List[List[int]],
+                old_weight: int, new_weight: int, append: Callable[[List[int]], None]) -> None:
+    """Fixed-point crossfade: appends (old * old_weight + new * new_weight) >> 8 per LED"""
+    for old_color, new_color in zip(old_rows, new_rows):
+        if old_color == new_color:
+            append(new_color)
+            continue
+        
+        old_r, old_g, old_b = old_color
+        new_r, new_g, new_b = new_color
+        append([
+            (old_r * old_weight + new_r * new_weight) >> 8,
+            (old_g * old_weight + new_g * new_weight) >> 8,
+            (old_b * old_weight + new_b * new_weight) >> 8
+        ])
 
 
 class DissolveTransition:
@@ -119,27 +177,64 @@ class DissolveTransition:
     Both patterns continue animating while crossfading according to per-LED timing
     """
     
-    def __init__(self, led_count: int = 225):
+    def __init__(self, led_count: int = DEFAULT_LED_COUNT):
         self.led_count = led_count
         self.phase = DissolvePhase.COMPLETED
+        self.phase_str = self.phase.value
         self.is_active = False
         
         self.old_pattern: Optional[PatternState] = None
         self.new_pattern: Optional[PatternState] = None
+        self.pattern_pair: Tuple[Optional[PatternState], Optional[PatternState]] = (None, None)
         
         self.pattern_data: List[List[int]] = []
         self.start_time: float = 0.0
+        self.end_time: float = 0.0
         
         self.led_states: List[LEDCrossfadeState] = []
+        self._timing_runs: List[LEDTimingRun] = []
+        self._old_frame: List[List[int]] = []
+        self._new_frame: List[List[int]] = []
         self._initialize_led_states()
         
         self.calculator: Optional[DualPatternCalculator] = None
         
         self._lock = threading.RLock()
         
+    def _set_phase(self, phase: DissolvePhase):
+        """
+        Update phase together with its derived values
+        phase_str is used by status queries; is_active is the single flag the render path checks
+        """
+        self.phase = phase
+        self.phase_str = phase.value
+        self.is_active = phase is DissolvePhase.CROSSFADING
+        
+    def _complete(self):
+        """Single exit point of the dissolve state machine"""
+        self._set_phase(DissolvePhase.COMPLETED)
+        
     def _initialize_led_states(self):
-        """Initialize per-LED crossfade states"""
-        self.led_states = [LEDCrossfadeState() for _ in range(self.led_count)]
+        """Size per-LED crossfade states and render buffers to led_count, reusing existing ones"""
+        led_count = self.led_count
+        led_states = self.led_states
+        if len(led_states) > led_count:
+            del led_states[led_count:]
+        else:
+            led_states.extend(LEDCrossfadeState() for _ in range(led_count - len(led_states)))
+        
+        ColorUtils.resize_frame(self._old_frame, led_count)
+        ColorUtils.resize_frame(self._new_frame, led_count)
+        
+    def preallocate(self, led_count: int):
+        """
+        Size per-LED states and render buffers ahead of the first dissolve
+        Lets a live start_dissolve reuse them instead of allocating; ignored while a dissolve is active
+        """
+        with self._lock:
+            if not self.is_active and self.led_count != led_count:
+                self.led_count = led_count
+                self._initialize_led_states()
         
     def set_calculator(self, calculator: DualPatternCalculator):
         """Set the dual pattern calculator"""
@@ -174,28 +269,30 @@ class DissolveTransition:
                 led_state.crossfade_start_time = 0.0
                 led_state.crossfade_duration_ms = 0
                 led_state.blend_progress = 0.0
+                led_state.crossfade_end_time = 0.0
+                led_state.inv_duration = 0.0
             
             self.old_pattern = old_pattern
             self.new_pattern = new_pattern
+            self.pattern_pair = (old_pattern, new_pattern)
             self.pattern_data = pattern_data
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
+            self.end_time = self.start_time
             
             if not pattern_data:
                 logger.warning("Empty pattern data - transition will be instant")
-                self.phase = DissolvePhase.COMPLETED
-                self.is_active = False
+                self._complete()
                 return
             
             valid_transitions = self._setup_crossfade_timing(pattern_data)
             
             if not valid_transitions:
                 logger.warning("No valid transitions - completing immediately")
-                self.phase = DissolvePhase.COMPLETED
-                self.is_active = False
+                self._complete()
                 return
             
-            self.phase = DissolvePhase.CROSSFADING
-            self.is_active = True
+            self._timing_runs = self._build_timing_runs()
+            self._set_phase(DissolvePhase.CROSSFADING)
             
             logger.info(f"Dual dissolve started: {len(valid_transitions)} valid transitions")
             
@@ -227,6 +324,10 @@ class DissolveTransition:
                 continue
             
             crossfade_start = self.start_time + (delay_ms / 1000.0)
+            crossfade_end = crossfade_start + (duration_ms / 1000.0)
+            inv_duration = 1000.0 / duration_ms
+            if crossfade_end > self.end_time:
+                self.end_time = crossfade_end
             
             leds_in_transition = 0
             for led_idx in range(start_led, end_led + 1):
@@ -236,6 +337,8 @@ class DissolveTransition:
                     led_state.crossfade_start_time = crossfade_start
                     led_state.crossfade_duration_ms = duration_ms
                     led_state.blend_progress = 0.0
+                    led_state.crossfade_end_time = crossfade_end
+                    led_state.inv_duration = inv_duration
                     
                     leds_in_transition += 1
                     leds_with_timing += 1
@@ -246,6 +349,37 @@ class DissolveTransition:
         logger.info(f"Crossfade timing setup: {leds_with_timing} LEDs have timing")
         return valid_transitions
         
+    def _build_timing_runs(self) -> List[LEDTimingRun]:
+        """
+        Group consecutive LEDs with identical timing into runs
+        Built from the final per-LED states, so overlapping pattern ranges are already resolved
+        """
+        runs: List[LEDTimingRun] = []
+        led_states = self.led_states
+        run_start = 0
+        
+        for led_idx in range(1, len(led_states) + 1):
+            first = led_states[run_start]
+            if led_idx < len(led_states):
+                led_state = led_states[led_idx]
+                if (led_state.crossfade_start_time == first.crossfade_start_time and
+                        led_state.crossfade_end_time == first.crossfade_end_time and
+                        led_state.crossfade_duration_ms == first.crossfade_duration_ms):
+                    continue
+            
+            runs.append(LEDTimingRun(
+                start_idx=run_start,
+                end_idx=led_idx,
+                crossfade_start_time=first.crossfade_start_time,
+                crossfade_end_time=first.crossfade_end_time,
+                crossfade_duration_ms=first.crossfade_duration_ms,
+                inv_duration=first.inv_duration,
+                states=led_states[run_start:led_idx]
+            ))
+            run_start = led_idx
+        
+        return runs
+        
     def _validate_transition_format(self, transition) -> bool:
         """
         Validate transition data format
@@ -271,84 +405,83 @@ class DissolveTransition:
         """
         Update crossfade progress and return blended LED array from both patterns
         Both patterns continue animating while being crossfaded
-        
+
         Args:
             current_time: Current timestamp for timing calculations
             
         Returns:
             Blended LED color array with dual pattern crossfade
         """
-        if not self.is_active or self.phase != DissolvePhase.CROSSFADING:
+        if not self.is_active:
             if self.new_pattern and self.calculator:
                 return self.calculator.calculate_pattern_colors(
-                    self.new_pattern, current_time, self.led_count
+                    self.new_pattern, current_time, self.led_count, self._new_frame
                 )
-            return [[0, 0, 0] for _ in range(self.led_count)]
+            return ColorUtils.get_black_frame(self.led_count)
         
         if not self.calculator or not self.old_pattern or not self.new_pattern:
             logger.error("Missing calculator or pattern states")
-            self.phase = DissolvePhase.COMPLETED
-            self.is_active = False
-            return [[0, 0, 0] for _ in range(self.led_count)]
+            self._complete()
+            return ColorUtils.get_black_frame(self.led_count)
+        
+        if current_time >= self.end_time:
+            for led_state in self.led_states:
+                if led_state.crossfade_duration_ms:
+                    led_state.blend_progress = 1.0
+            self._complete()
+            logger.info("Dual dissolve completed: all crossfades finished")
+            return self.calculator.calculate_pattern_colors(
+                self.new_pattern, current_time, self.led_count, self._new_frame
+            )
         
         old_colors = self.calculator.calculate_pattern_colors(
-            self.old_pattern, current_time, self.led_count
+            self.old_pattern, current_time, self.led_count, self._old_frame
         )
         new_colors = self.calculator.calculate_pattern_colors(
-            self.new_pattern, current_time, self.led_count
+            self.new_pattern, current_time, self.led_count, self._new_frame
         )
         
-        result_array = [[0, 0, 0] for _ in range(self.led_count)]
-        completed_count = 0
-        total_with_timing = 0
+        led_count = self.led_count
+        black = [0, 0, 0]
+        if len(old_colors) < led_count:
+            old_colors = old_colors + [black] * (led_count - len(old_colors))
+        if len(new_colors) < led_count:
+            new_colors = new_colors + [black] * (led_count - len(new_colors))
         
-        for led_idx in range(self.led_count):
-            if led_idx >= len(self.led_states):
-                result_array[led_idx] = new_colors[led_idx] if led_idx < len(new_colors) else [0, 0, 0]
-                continue
-                
-            led_state = self.led_states[led_idx]
+        result_array = []
+        extend = result_array.extend
+        append = result_array.append
+        
+        for run in self._timing_runs:
+            start_idx = run.start_idx
+            end_idx = run.end_idx
             
-            if led_state.crossfade_duration_ms == 0:
-                result_array[led_idx] = new_colors[led_idx] if led_idx < len(new_colors) else [0, 0, 0]
+            if run.crossfade_duration_ms == 0:
+                extend(new_colors[start_idx:end_idx])
                 continue
             
-            total_with_timing += 1
-            
-            if current_time < led_state.crossfade_start_time:
-                led_state.blend_progress = 0.0
-                result_array[led_idx] = old_colors[led_idx] if led_idx < len(old_colors) else [0, 0, 0]
+            if current_time < run.crossfade_start_time:
+                progress = 0.0
+            elif current_time >= run.crossfade_end_time:
+                progress = 1.0
             else:
-                elapsed_ms = (current_time - led_state.crossfade_start_time) * 1000
-                
-                if elapsed_ms >= led_state.crossfade_duration_ms:
-                    led_state.blend_progress = 1.0
-                    result_array[led_idx] = new_colors[led_idx] if led_idx < len(new_colors) else [0, 0, 0]
-                    completed_count += 1
-                else:
-                    if led_state.crossfade_duration_ms > 0:
-                        progress = elapsed_ms / led_state.crossfade_duration_ms
-                        progress = min(1.0, max(0.0, progress))
-                    else:
-                        progress = 1.0
-                    
+                progress = (current_time - run.crossfade_start_time) * run.inv_duration
+            
+            if progress != run.progress:
+                for led_state in run.states:
                     led_state.blend_progress = progress
-                    
-                    old_color = old_colors[led_idx] if led_idx < len(old_colors) else [0, 0, 0]
-                    new_color = new_colors[led_idx] if led_idx < len(new_colors) else [0, 0, 0]
-                    
-                    old_factor = 1.0 - progress
-                    new_factor = progress
-                    
-                    result_array[led_idx] = [
-                        int(old_color[0] * old_factor + new_color[0] * new_factor),
-                        int(old_color[1] * old_factor + new_color[1] * new_factor),
-                        int(old_color[2] * old_factor + new_color[2] * new_factor)
-                    ]
-        
-        if total_with_timing > 0 and completed_count >= total_with_timing:
-            self.phase = DissolvePhase.COMPLETED
-            self.is_active = False
-            logger.info(f"Dual dissolve completed: {completed_count}/{total_with_timing} LEDs finished")
+                run.progress = progress
+            
+            if progress == 0.0:
+                extend(old_colors[start_idx:end_idx])
+                continue
+            
+            if progress == 1.0:
+                extend(new_colors[start_idx:end_idx])
+                continue
+            
+            new_weight = int(progress * 256 + 0.5)
+            _blend_rows(old_colors[start_idx:end_idx], new_colors[start_idx:end_idx],
+                        256 - new_weight, new_weight, append)
         
         return result_array
\ No newline at end of file
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 import time
 from src.utils.color_utils import ColorUtils
 from .segment import Segment
+from .types import DEFAULT_LED_COUNT
 
 
 @dataclass
@@ -57,9 +58,9 @@ class Effect:
             segment_end = int(segment.current_position) + segment.get_total_led_count()
             max_led_index = max(max_led_index, segment_end)
         
-        led_count = max(225, max_led_index) 
+        led_count = max(DEFAULT_LED_COUNT, max_led_index)
         led_colors = [[0, 0, 0] for _ in range(led_count)]
-        current_time = time.time()
+        current_time = time.perf_counter()
         
         self.render_to_led_array(palette, current_time, led_colors)
         
@@ -80,7 +81,7 @@ class Effect:
         Create an effect from a dictionary
         """
         try:
-            effect_id = data.get("effect_id", data.get("effect_ID", 0))
+            effect_id = int(data.get("effect_id", data.get("effect_ID", 0)))
             
             effect = cls(effect_id=effect_id)
             
@@ -132,6 +133,18 @@ class Effect:
             total = max(total, segment_end)
         return total
     
+    def get_expected_led_count(self) -> int:
+        """
+        Get number of LEDs expected to light up (segments with at least one valid color)
+        Uses one summary pass per segment so it is cheap enough for status logging
+        """
+        total = 0
+        for segment in self.segments.values():
+            total_length, has_color = segment.summary()
+            if has_color:
+                total += total_length
+        return total
+    
     def get_stats(self) -> Dict[str, Any]:
         """
         Get effect statistics
@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 import time
 
 from .effect import Effect
+from .types import DEFAULT_LED_COUNT
+from src.utils.color_utils import ColorUtils
 
 
 @dataclass 
@@ -17,7 +19,7 @@ class Scene:
     """
     
     scene_id: int
-    led_count: int = 225
+    led_count: int = DEFAULT_LED_COUNT
     fps: int = 60
     current_effect_id: int = 0
     current_palette_id: int = 0
@@ -95,9 +97,9 @@ class Scene:
             palette = self.get_current_palette()
             total_leds = self.get_total_led_count()
             led_array = [[0, 0, 0] for _ in range(total_leds)]
-            current_effect.render_to_led_array(palette, time.time(), led_array)
+            current_effect.render_to_led_array(palette, time.perf_counter(), led_array)
             return led_array
-        return [[0, 0, 0] for _ in range(self.led_count)]
+        return ColorUtils.get_black_frame(self.led_count)
     
     def get_led_output_with_timing(self, current_time: float) -> List[List[int]]:
         """
@@ -105,7 +107,7 @@ class Scene:
         """
         current_effect = self.get_current_effect()
         if not current_effect:
-            return [[0, 0, 0] for _ in range(self.led_count)]
+            return ColorUtils.get_black_frame(self.led_count)
         
         total_leds = self.get_total_led_count()
         led_array = [[0, 0, 0] for _ in range(total_leds)]
@@ -154,6 +156,14 @@ class Scene:
             "effects": [effect.to_dict() for effect in self.effects]
         }
     
+    @staticmethod
+    def _copy_palette(palette: List[List[int]]) -> List[List[int]]:
+        """
+        Copy the palette list so edits never alias the source (possibly cached) data
+        Colors are only ever replaced whole, never mutated in place, so they are shared
+        """
+        return list(palette)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Scene':
         """
@@ -161,7 +171,7 @@ class Scene:
         """
         try:
             scene_id = data.get("scene_id", data.get("scene_ID", 0))
-            led_count = data.get("led_count", 225)
+            led_count = data.get("led_count", DEFAULT_LED_COUNT)
             fps = data.get("fps", 60)
             current_effect_id = data.get("current_effect_id", data.get("current_effect_ID", 0))
             
@@ -181,26 +191,19 @@ class Scene:
             
             palettes_data = data.get("palettes", {})
             if isinstance(palettes_data, dict):
-                max_id = 0
-                for key in palettes_data.keys():
-                    if isinstance(key, str):
-                        palette_id = ord(key.upper()) - ord('A')
-                    else:
-                        palette_id = int(key)
-                    max_id = max(max_id, palette_id)
+                palettes_by_id = {
+                    ord(key.upper()) - ord('A') if isinstance(key, str) else int(key): palette
+                    for key, palette in palettes_data.items()
+                }
+                max_id = max(palettes_by_id, default=0)
                 
-                scene.palettes = [[[255, 255, 255]] * 6 for _ in range(max_id + 1)]
+                scene.palettes = [[[255, 255, 255]] * 6 for _ in range(max(0, max_id) + 1)]
                 
-                for key, palette in palettes_data.items():
-                    if isinstance(key, str):
-                        palette_id = ord(key.upper()) - ord('A')
-                    else:
-                        palette_id = int(key)
-                    
+                for palette_id, palette in palettes_by_id.items():
                     if 0 <= palette_id < len(scene.palettes):
-                        scene.palettes[palette_id] = palette
+                        scene.palettes[palette_id] = cls._copy_palette(palette)
             else:
-                scene.palettes = palettes_data or [[[255, 255, 255]] * 6]
+                scene.palettes = [cls._copy_palette(palette) for palette in palettes_data] or [[[255, 255, 255]] * 6]
             
             effects_data = data.get("effects", {})
             if isinstance(effects_data, dict):
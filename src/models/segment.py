@@ -11,6 +11,7 @@ import math
 from ..utils.validation import ValidationUtils, DataSanitizer, log_validation_error
 from ..utils.logging import LoggingUtils, AnimationLogger
 from ..utils.color_utils import ColorUtils
+from .types import DEFAULT_LED_COUNT
 
 
 @dataclass
@@ -55,7 +56,7 @@ class Segment:
         while len(self.length) < len(self.color):
             self.length.append(1)
         
-        self.segment_start_time = time.time()
+        self.segment_start_time = time.perf_counter()
         self._fractional_accumulator = 0.0
         
         if not self.dimmer_time or not isinstance(self.dimmer_time[0], list):
@@ -64,7 +65,10 @@ class Segment:
         self._validate_dimmer_time()
     
     def _validate_dimmer_time(self):
-        """Validate dimmer_time data"""
+        """
+        Validate dimmer_time data
+        Always rebuilds every step as a new list, so source (possibly cached) data is never aliased
+        """
         if not self.dimmer_time:
             self.dimmer_time = [[1000, 0, 100]]
             return
@@ -84,18 +88,18 @@ class Segment:
     def reset_animation_timing(self):
         """Reset animation timing but preserve pause state and accumulated pause time"""
         if not self.is_paused: 
-            self.segment_start_time = time.time()
+            self.segment_start_time = time.perf_counter()
     
     def pause_segment(self):
         """Pause the segment animation"""
         if not self.is_paused:
-            self.pause_start_time = time.time()
+            self.pause_start_time = time.perf_counter()
             self.is_paused = True
 
     def resume_segment(self):
         """Resume the segment animation with position continuity"""
         if self.is_paused and self.pause_start_time is not None:
-            pause_duration = time.time() - self.pause_start_time
+            pause_duration = time.perf_counter() - self.pause_start_time
             self.total_paused_time += pause_duration
             
             self.pause_start_time = None
@@ -136,19 +140,23 @@ class Segment:
         return max(0.0, min(1.0, last_step[2] / 100.0))
     
     def update_position(self, delta_time: float):
-        """Update position with enhanced boundary enforcement and pause handling"""
-        if self.is_paused or abs(self.move_speed) < 0.001:
+        """
+        Update position with enhanced boundary enforcement and pause handling
+        Boundaries are only re-evaluated on frames where the position moves a whole LED
+        """
+        move_speed = self.move_speed
+        if self.is_paused or -0.001 < move_speed < 0.001:
             return
         
-        if not hasattr(self, '_fractional_accumulator'):
-            self._fractional_accumulator = 0.0
+        accumulator = self._fractional_accumulator + move_speed * delta_time
         
-        self._fractional_accumulator += self.move_speed * delta_time
+        if -1.0 < accumulator < 1.0:
+            self._fractional_accumulator = accumulator
+            return
         
-        if abs(self._fractional_accumulator) >= 1.0:
-            position_change = int(self._fractional_accumulator)
-            self.current_position += position_change
-            self._fractional_accumulator -= position_change
+        position_change = int(accumulator)
+        self.current_position += position_change
+        self._fractional_accumulator = accumulator - position_change
         
         total_segment_length = self.get_total_led_count()
         
@@ -164,14 +172,14 @@ class Segment:
                 
                 if self.current_position <= min_pos:
                     self.current_position = min_pos
-                    if self.move_speed < 0:
-                        self.move_speed = abs(self.move_speed)
+                    if move_speed < 0:
+                        self.move_speed = -move_speed
                         direction_changed = True
                 
                 elif self.current_position >= effective_max_pos:
                     self.current_position = effective_max_pos
-                    if self.move_speed > 0:
-                        self.move_speed = -abs(self.move_speed)
+                    if move_speed > 0:
+                        self.move_speed = -move_speed
                         direction_changed = True
                 
                 if direction_changed and not self.is_paused:
@@ -190,10 +198,15 @@ class Segment:
                         self.current_position = int(min_pos + (offset % range_size))
 
     def get_led_colors_with_timing(self, palette, current_time):
+        """
+        Get per-LED colors for this segment at the given time
+        Brightness is resolved once per segment and each part's color once per part
+        """
         if not palette or len(palette) == 0:
             return []
         
         colors = []
+        dimmer_factor = None
         
         for part_index in range(len(self.color)):
             part_length = self.length[part_index] if part_index < len(self.length) else 0
@@ -207,26 +220,24 @@ class Segment:
             if transparency >= 1.0:
                 continue 
             
-            if color_index < 0 or color_index >= len(palette):
+            if not 0 <= color_index < len(palette):
                 color_index = 0
             
+            if dimmer_factor is None:
+                dimmer_factor = self.get_brightness_at_time(current_time)
+            
             base_color = palette[color_index]
-            dimmer_factor = self.get_brightness_at_time(current_time)
             opacity = 1.0 - transparency
             final_brightness = opacity * dimmer_factor
 
             if final_brightness <= 0.0:
                 continue
 
-            for led_in_part in range(part_length):
-                final_color = [
-                    int(base_color[0] * final_brightness),
-                    int(base_color[1] * final_brightness), 
-                    int(base_color[2] * final_brightness)
-                ]
-                
-                final_color = [max(0, min(255, c)) for c in final_color]
-                colors.append(final_color)
+            r = max(0, min(255, int(base_color[0] * final_brightness)))
+            g = max(0, min(255, int(base_color[1] * final_brightness)))
+            b = max(0, min(255, int(base_color[2] * final_brightness)))
+            
+            colors.extend([r, g, b] for _ in range(part_length))
         
         return colors
 
@@ -237,57 +248,59 @@ class Segment:
         if not segment_colors:
             return
         
-        try:
-            base_position = int(self.current_position)
+        base_position = int(self.current_position)
+        
+        if len(self.move_range) >= 2 and self.move_range[0] == 0 and self.move_range[1] == 0:
+            base_position = max(0, base_position)
             
-            if len(self.move_range) >= 2 and self.move_range[0] == 0 and self.move_range[1] == 0:
-                base_position = max(0, base_position)
-                
-                if base_position >= len(led_array):
-                    return
-                    
-                available_leds = len(led_array) - base_position
-                if len(segment_colors) > available_leds:
-                    segment_colors = segment_colors[:available_leds]
-                
-                for led_index in range(len(segment_colors)):
-                    final_led_index = base_position + led_index
-                    
-                    if 0 <= final_led_index < len(led_array):
-                        validated_color = ColorUtils.validate_rgb_color(segment_colors[led_index])
-                        led_transparency = self.get_transparency_for_led_index(led_index)
-
-                        if led_transparency >= 1.0:
-                            continue 
-                            
-                        ColorUtils.add_colors_to_led_array(led_array, final_led_index, validated_color)
+            if base_position >= len(led_array):
                 return
-            
-            max_allowed_position = self.move_range[1] - len(segment_colors) + 1 if len(self.move_range) >= 2 else len(led_array) - len(segment_colors)
-            safe_position = min(base_position, max_allowed_position)
-            
-            if safe_position < 0:
-                if safe_position < -len(segment_colors):
-                    return
                 
-                skip_count = abs(safe_position)
-                segment_colors = segment_colors[skip_count:]
-                safe_position = 0
+            available_leds = len(led_array) - base_position
+            if len(segment_colors) > available_leds:
+                segment_colors = segment_colors[:available_leds]
             
             for led_index in range(len(segment_colors)):
-                final_led_index = safe_position + led_index
+                final_led_index = base_position + led_index
                 
                 if 0 <= final_led_index < len(led_array):
-                    validated_color = ColorUtils.validate_rgb_color(segment_colors[led_index])
-                    ColorUtils.add_colors_to_led_array(led_array, final_led_index, validated_color)
-                    
-        except Exception as e:
-            pass
+                    led_transparency = self.get_transparency_for_led_index(led_index)
+
+                    if led_transparency >= 1.0:
+                        continue 
+                        
+                    ColorUtils.add_colors_to_led_array(led_array, final_led_index, segment_colors[led_index])
+            return
+        
+        max_allowed_position = self.move_range[1] - len(segment_colors) + 1 if len(self.move_range) >= 2 else len(led_array) - len(segment_colors)
+        safe_position = min(base_position, max_allowed_position)
+        
+        if safe_position < 0:
+            if safe_position < -len(segment_colors):
+                return
+            
+            skip_count = abs(safe_position)
+            segment_colors = segment_colors[skip_count:]
+            safe_position = 0
+        
+        for led_index in range(len(segment_colors)):
+            final_led_index = safe_position + led_index
+            
+            if 0 <= final_led_index < len(led_array):
+                ColorUtils.add_colors_to_led_array(led_array, final_led_index, segment_colors[led_index])
+
+    def summary(self):
+        """
+        Get (total_length, has_color) for this segment in one pass over its parts
+        """
+        total_length = sum(max(0, length) for length in self.length)
+        has_color = any(c >= 0 for c in self.color)
+        return total_length, has_color
 
     def get_total_led_count(self) -> int:
         """Get total number of LEDs this segment will generate"""
         try:
-            total = sum(max(0, length) for length in self.length)
+            total, _ = self.summary()
             
             if len(self.color) > len(self.length):
                 total += len(self.color) - len(self.length)
@@ -321,11 +334,11 @@ class Segment:
             
             segment = cls(
                 segment_id=data.get("segment_id", data.get("segment_ID", 0)),  
-                color=data.get("color", [0]),
-                transparency=data.get("transparency", [1.0]),
-                length=data.get("length", [1]),
+                color=list(data.get("color", [0])),
+                transparency=list(data.get("transparency", [1.0])),
+                length=list(data.get("length", [1])),
                 move_speed=data.get("move_speed", 0.0),
-                move_range=data.get("move_range", [0, 224]),
+                move_range=list(data.get("move_range", [0, 224])),
                 initial_position= int(data.get("initial_position", 0)),
                 current_position= int(data.get("current_position", 0)),
                 is_edge_reflect=data.get("is_edge_reflect", True),
@@ -366,8 +379,9 @@ class Segment:
     def is_active(self) -> bool:
         """Check if the segment is active"""
         try:
-            return (any(c >= 0 for c in self.color) and 
-                    sum(max(0, length) for length in self.length) > 0 and
+            total_length, has_color = self.summary()
+            return (has_color and 
+                    total_length > 0 and
                     any(t > 0 for t in self.transparency))
         except Exception:
             return False
@@ -423,7 +437,7 @@ class Segment:
             AnimationLogger.log_validation_error("segment_validation", str(e), segment_id=self.segment_id)
             return False
     
-    def sanitize(self, led_count: int = 225):
+    def sanitize(self, led_count: int = DEFAULT_LED_COUNT):
         """Sanitize segment data using centralized sanitization utilities"""
         try:
             self.segment_id = DataSanitizer.sanitize_int(self.segment_id, 0, 0, ValidationUtils.MAX_SEGMENT_ID)
@@ -1,5 +1,9 @@
 from enum import Enum
 
+# Fallback LED count used when no scene defines one
+DEFAULT_LED_COUNT = 225
+
+
 class TransitionPhase(Enum):
     """Pattern transition phases"""
     FADE_OUT = "fade_out"
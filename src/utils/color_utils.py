@@ -11,6 +11,34 @@ logger = setup_logger(__name__)
 class ColorUtils:
     
     _led_contributions = {} 
+    _black_frames = {}
+    _fade_table = []
+    _fade_bytes = b""
+    _fade_table_brightness = -1
+    
+    @staticmethod
+    def get_black_frame(led_count: int) -> list:
+        """
+        Get cached all-black LED frame - shared object, callers must not modify it
+        Cached per LED count, so scenes with different counts never rebuild each other's frame
+        """
+        frame = ColorUtils._black_frames.get(led_count)
+        if frame is None:
+            frame = ColorUtils._black_frames[led_count] = [[0, 0, 0]] * max(0, led_count)
+        return frame
+    
+    @staticmethod
+    def resize_frame(frame: list, led_count: int) -> list:
+        """
+        Grow or truncate a reusable frame buffer in place, keeping its existing rows
+        Added rows are distinct black lists, so the buffer can still be written row by row
+        """
+        size = len(frame)
+        if size > led_count:
+            del frame[max(0, led_count):]
+        elif size < led_count:
+            frame.extend([0, 0, 0] for _ in range(led_count - size))
+        return frame
     
     @staticmethod
     def reset_frame_contributions():
@@ -19,31 +47,51 @@ class ColorUtils:
     
     @staticmethod
     def add_colors_to_led_array(led_array, led_index: int, color, weight: float = 1.0):
-        """Add color contribution for averaging - replaces old additive method"""
-        if led_index < 0 or led_index >= len(led_array):
+        """
+        Add color contribution for averaging - replaces old additive method
+        The color is stored by reference (only its first 3 channels are read), so it must not be
+        mutated before finalize_frame_blending
+        """
+        if not 0 <= led_index < len(led_array):
             return
-            
-        if led_index not in ColorUtils._led_contributions:
-            ColorUtils._led_contributions[led_index] = []
-        ColorUtils._led_contributions[led_index].append((color[:3], weight))
+        
+        contributions = ColorUtils._led_contributions.get(led_index)
+        if contributions is None:
+            ColorUtils._led_contributions[led_index] = [(color, weight)]
+        else:
+            contributions.append((color, weight))
     
     @staticmethod
     def finalize_frame_blending(led_array):
+        """
+        Write the weighted average of each LED's contributions into led_array
+        A lone full-weight contribution (the common case) is clamped directly, skipping the sums
+        Rows are overwritten in place, so a reused frame buffer allocates nothing per lit LED;
+        led_array must therefore hold a distinct list per LED
+        """
+        led_count = len(led_array)
         for led_index, contributions in ColorUtils._led_contributions.items():
-            if led_index < len(led_array):
+            if led_index < led_count:
+                led = led_array[led_index]
+                if len(contributions) == 1:
+                    color, weight = contributions[0]
+                    if weight == 1.0:
+                        led[0] = min(255, max(0, int(color[0])))
+                        led[1] = min(255, max(0, int(color[1])))
+                        led[2] = min(255, max(0, int(color[2])))
+                        continue
+                
                 total_weight = sum(weight for _, weight in contributions)
                 if total_weight > 0:
                     avg_r = sum(color[0] * weight for color, weight in contributions) / total_weight
                     avg_g = sum(color[1] * weight for color, weight in contributions) / total_weight
                     avg_b = sum(color[2] * weight for color, weight in contributions) / total_weight
                     
-                    led_array[led_index] = [
-                        min(255, max(0, int(avg_r))),
-                        min(255, max(0, int(avg_g))),
-                        min(255, max(0, int(avg_b)))
-                    ]
+                    led[0] = min(255, max(0, int(avg_r)))
+                    led[1] = min(255, max(0, int(avg_g)))
+                    led[2] = min(255, max(0, int(avg_b)))
                 else:
-                    led_array[led_index] = [0, 0, 0]
+                    led[0] = led[1] = led[2] = 0
 
     @staticmethod
     def clamp_color_value(value: int) -> int:
@@ -99,7 +147,7 @@ class ColorUtils:
         if not palette or len(palette) == 0:
             return [0, 0, 0]
         
-        if color_index < 0 or color_index >= len(palette):
+        if not 0 <= color_index < len(palette):
             return [0, 0, 0]
         
         color = palette[color_index]
@@ -154,13 +202,35 @@ class ColorUtils:
     @staticmethod
     def apply_colors_to_array(led_colors, master_brightness: int = 255) -> list:
         """Apply master brightness to entire LED array"""
-        if master_brightness == 255:
+        if master_brightness >= 255:
             return led_colors
         
+        fade_table = ColorUtils._get_fade_table(max(0, int(master_brightness)))
         return [
-            ColorUtils.apply_master_brightness(color, master_brightness)
+            [fade_table[color[0]], fade_table[color[1]], fade_table[color[2]]]
             for color in led_colors
         ]
+    
+    @staticmethod
+    def _get_fade_table(master_brightness: int) -> list:
+        """
+        Get 256-entry lookup table mapping channel value to faded value for a brightness
+        Exact integer scaling, rebuilt only when master brightness changes
+        """
+        if ColorUtils._fade_table_brightness != master_brightness:
+            ColorUtils._fade_table = [c * master_brightness // 255 for c in range(256)]
+            ColorUtils._fade_bytes = bytes(ColorUtils._fade_table)
+            ColorUtils._fade_table_brightness = master_brightness
+        return ColorUtils._fade_table
+    
+    @staticmethod
+    def get_fade_bytes(master_brightness: int) -> bytes:
+        """
+        Get the fade table as a bytes.translate table for packed channel data
+        Same exact integer scaling as apply_colors_to_array, applied at C speed
+        """
+        ColorUtils._get_fade_table(max(0, min(255, int(master_brightness))))
+        return ColorUtils._fade_bytes
 
     @staticmethod
     def interpolate_color(color1: list, color2: list, factor: float) -> list:
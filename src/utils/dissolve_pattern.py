@@ -3,11 +3,11 @@ Dissolve pattern management for LED Animation Engine
 Handles loading and managing dissolve patterns from JSON files
 """
 
-from typing import List, Dict, Any, Optional
-import json
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from src.utils.logger import ComponentLogger
+from src.utils.json_utils import parse_json
 
 logger = ComponentLogger("DissolvePattern")
 
@@ -21,6 +21,11 @@ class DissolvePatternManager:
     def __init__(self):
         self.patterns: Dict[int, List[List[int]]] = {}
         self.current_pattern_id: Optional[int] = None
+        self._pattern_ids: Tuple[int, ...] = ()
+    
+    def _refresh_pattern_ids(self):
+        """Rebuild cached sorted pattern IDs - call whenever patterns change"""
+        self._pattern_ids = tuple(sorted(self.patterns.keys()))
     
     def load_patterns_from_json(self, file_path: str) -> bool:
         """
@@ -38,8 +43,7 @@ class DissolvePatternManager:
                 logger.error(f"Dissolve pattern file not found: {file_path}")
                 return False
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = parse_json(file_path_obj.read_bytes())
             
             if 'dissolve_patterns' not in data:
                 logger.error(f"Invalid JSON: missing 'dissolve_patterns' key in {file_path}")
@@ -73,17 +77,19 @@ class DissolvePatternManager:
                     logger.warning(f"Skipping invalid pattern {pattern_id_str}: {e}")
                     continue
             
+            self._refresh_pattern_ids()
+            
             logger.info(f"Loaded {patterns_loaded} dissolve patterns from {file_path}")
             
             if patterns_loaded > 0:
-                available_ids = list(self.patterns.keys())
-                logger.info(f"Available pattern IDs: {sorted(available_ids)}")
+                logger.info(f"Available pattern IDs: {list(self._pattern_ids)}")
                 return True
             else:
                 logger.error("No valid patterns found in file")
                 return False
             
         except Exception as e:
+            self._refresh_pattern_ids()
             logger.error(f"Failed to load dissolve patterns from {file_path}: {e}")
             return False
     
@@ -146,11 +152,14 @@ class DissolvePatternManager:
             logger.info(f"Active dissolve pattern changed: {old_pattern} → {pattern_id}")
             return True
         else:
-            available = list(self.patterns.keys())
-            logger.warning(f"Pattern {pattern_id} not found. Available patterns: {available}")
+            logger.warning(f"Pattern {pattern_id} not found. Available patterns: {list(self._pattern_ids)}")
             return False
     
     def get_available_patterns(self) -> List[int]:
         """Get list of available pattern IDs"""
-        return sorted(list(self.patterns.keys()))
+        return list(self._pattern_ids)
+    
+    def get_pattern_ids(self) -> Tuple[int, ...]:
+        """Get cached sorted pattern IDs without allocating a new list"""
+        return self._pattern_ids
     
\ No newline at end of file
@@ -7,11 +7,13 @@ Auto-adjust target FPS to ensure stable output and prevent LED lag/jitter
 import time
 import threading
 from collections import deque
-from typing import Dict, List, Optional, Callable, Any
+from itertools import islice
+from typing import Dict, Optional, Callable, Any, Tuple
 from dataclasses import dataclass
 
 from config.settings import EngineSettings
 from src.models.common import FPSAdjustment
+from src.models.types import DEFAULT_LED_COUNT
 from src.utils.logging import LoggingUtils
 
 
@@ -45,7 +47,7 @@ class FPSBalancer:
         
         self.running = False
         self._lock = threading.RLock()
-        self.callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self.callbacks: Tuple[Callable[[Dict[str, Any]], None], ...] = ()
         
     def start(self):
         """Start FPS balancer"""
@@ -58,7 +60,7 @@ class FPSBalancer:
         """Add a callback for FPS events"""
         with self._lock:
             if callback not in self.callbacks:
-                self.callbacks.append(callback)
+                self.callbacks = self.callbacks + (callback,)
 
     def stop(self):
         """Stop FPS balancer"""
@@ -74,7 +76,14 @@ class FPSBalancer:
                 self._evaluate_fps_adjustment()
     
     def update_led_count(self, led_count: int):
-        """Update LED count and trigger evaluation if significant change"""
+        """
+        Update LED count and trigger evaluation if significant change
+        Called every frame; the LED count is fixed per install, so an unchanged count returns without locking
+        """
+        history = self.led_count_history
+        if history and history[-1] == led_count:
+            return
+        
         with self._lock:
             self.led_count_history.append(led_count)
             
@@ -102,15 +111,15 @@ class FPSBalancer:
         if not self.running or not self.processing_times:
             return
         
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_adjustment_time < self.adjustment_cooldown:
             return
         
-        avg_processing = sum(list(self.processing_times)[-5:]) / min(5, len(self.processing_times))
+        avg_processing = sum(islice(reversed(self.processing_times), 5)) / min(5, len(self.processing_times))
         target_loop_time = 1.0 / self.current_target_fps
         efficiency = min(1.0, target_loop_time / max(0.001, avg_processing))
         
-        led_count = self.led_count_history[-1] if self.led_count_history else 225
+        led_count = self.led_count_history[-1] if self.led_count_history else DEFAULT_LED_COUNT
         
         if efficiency < self.adjustment_threshold:
             new_target = max(self.min_fps, 1.0 / avg_processing * 0.9) 
@@ -137,13 +146,13 @@ class FPSBalancer:
         with self._lock:
             old_target = self.current_target_fps
             self.current_target_fps = max(self.min_fps, min(self.max_fps, new_target))
-            self.last_adjustment_time = time.time()
+            self.last_adjustment_time = time.monotonic()
             
             if self.animation_engine and hasattr(self.animation_engine, 'set_target_fps'):
                 self.animation_engine.set_target_fps(self.current_target_fps, propagate_to_balancer=False)
             
             led_count = self.led_count_history[-1] if self.led_count_history else 0
-            avg_processing = sum(list(self.processing_times)[-3:]) / min(3, len(self.processing_times)) if self.processing_times else 0.0
+            avg_processing = sum(islice(reversed(self.processing_times), 3)) / min(3, len(self.processing_times)) if self.processing_times else 0.0
             
             adjustment = FPSAdjustment(
                 old_target=old_target,
@@ -157,21 +166,24 @@ class FPSBalancer:
             self._clear_history()
 
     def _notify_adjustment(self, adj: FPSAdjustment):
-        """Notify listeners about the FPS adjustment"""
-        with self._lock:
-            event_data = {
-                "type": "target_fps_adjusted",
-                "old_target": adj.old_target,
-                "new_target": adj.new_target,
-                "reason": adj.reason,
-                "led_count": adj.led_count,
-                "avg_processing_time": adj.avg_processing_time
-            }
-            for callback in self.callbacks:
-                try:
-                    callback(event_data)
-                except Exception as e:
-                    logger.error(f"Error in FPS balancer callback: {e}")
+        """Notify listeners about the FPS adjustment - iterates the immutable callback tuple"""
+        callbacks = self.callbacks
+        if not callbacks:
+            return
+        
+        event_data = {
+            "type": "target_fps_adjusted",
+            "old_target": adj.old_target,
+            "new_target": adj.new_target,
+            "reason": adj.reason,
+            "led_count": adj.led_count,
+            "avg_processing_time": adj.avg_processing_time
+        }
+        for callback in callbacks:
+            try:
+                callback(event_data)
+            except Exception as e:
+                logger.error(f"Error in FPS balancer callback: {e}")
     
     def _clear_history(self):
         """Clear performance history after adjustment"""
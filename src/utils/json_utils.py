@@ -0,0 +1,19 @@
+"""
+JSON parsing utilities for LED Animation Engine
+Uses orjson when it is installed, falling back to the stdlib json module
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(raw: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text with orjson when available, falling back to the stdlib json module"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
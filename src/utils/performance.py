@@ -27,9 +27,10 @@ class PerformanceMonitor:
     def record_frame(self, frame_time: float):
         """
         Record time for a frame
+        frame_time is the frame start timestamp from the animation loop (time.perf_counter)
         """
         with self._lock:
-            current_time = time.time()
+            current_time = frame_time
             
             if self.last_frame_time > 0:
                 delta = current_time - self.last_frame_time
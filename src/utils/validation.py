@@ -5,6 +5,7 @@ Eliminates duplicate validation code and provides consistent error handling
 
 from typing import Any, List, Union, Tuple, Optional, Dict
 from .logger import setup_logger
+from ..models.types import DEFAULT_LED_COUNT
 
 try:
     from config.settings import EngineSettings
@@ -321,7 +322,7 @@ class DataSanitizer:
         return sanitized[:target_length]
     
     @staticmethod
-    def sanitize_move_range(move_range: List[float], led_count: int = 225) -> List[float]:
+    def sanitize_move_range(move_range: List[float], led_count: int = DEFAULT_LED_COUNT) -> List[float]:
         """Sanitize move range"""
         if not isinstance(move_range, list) or len(move_range) < 2:
             return [0.0, float(max(1, led_count - 1))]
@@ -346,9 +347,9 @@ class DataSanitizer:
         default_range = ValidationUtils.get_default_led_count_range()
         
         if max_override is not None:
-            return DataSanitizer.sanitize_int(led_count, 225, default_range[0], max_override)
+            return DataSanitizer.sanitize_int(led_count, DEFAULT_LED_COUNT, default_range[0], max_override)
         
-        return DataSanitizer.sanitize_int(led_count, 225, default_range[0], default_range[1])
+        return DataSanitizer.sanitize_int(led_count, DEFAULT_LED_COUNT, default_range[0], default_range[1])
     
     @staticmethod
     def sanitize_speed_percent(speed_percent: int) -> int:
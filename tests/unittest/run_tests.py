@@ -15,6 +15,7 @@ sys.path.insert(0, str(project_root))
 from tests.unittest.test_color_utils import TestColorUtils
 from tests.unittest.test_segment import TestSegment
 from tests.unittest.test_dissolve_pattern import TestDissolveTransition
+from tests.unittest.test_scene_manager import TestSceneManager
 
 
 class TestRunner:
@@ -25,7 +26,8 @@ class TestRunner:
         self.test_classes = [
             TestColorUtils,
             TestSegment,
-            TestDissolveTransition
+            TestDissolveTransition,
+            TestSceneManager
         ]
         self.test_suite = unittest.TestSuite()
         self.test_results = []
@@ -77,10 +79,11 @@ class TestRunner:
         
         # Print test class breakdown
         print("\nTest Class Breakdown:")
-        print(f"- TestColorUtils: 17 test methods (color processing, blending)")
+        print(f"- TestColorUtils: 21 test methods (color processing, blending)")
         print(f"- TestSegment: 29 test methods (animation logic, positioning)")
-        print(f"- TestDissolveTransition: 22 test methods (dual pattern crossfade)")
-        print(f"- Total: 68 comprehensive test methods")
+        print(f"- TestDissolveTransition: 27 test methods (dual pattern crossfade)")
+        print(f"- TestSceneManager: 27 test methods (scene loading, cached pattern changes)")
+        print(f"- Total: 104 comprehensive test methods")
         
         if result.wasSuccessful():
             print("\nALL TESTS PASSED!")
@@ -107,7 +110,8 @@ class TestRunner:
         test_class_map = {
             "ColorUtils": TestColorUtils,
             "Segment": TestSegment,
-            "DissolveTransition": TestDissolveTransition
+            "DissolveTransition": TestDissolveTransition,
+            "SceneManager": TestSceneManager
         }
         
         if test_class_name not in test_class_map:
@@ -134,8 +138,9 @@ class TestRunner:
             "color": [TestColorUtils],
             "animation": [TestSegment],
             "dissolve": [TestDissolveTransition],
+            "scene": [TestSceneManager],
             "core": [TestColorUtils, TestSegment],
-            "advanced": [TestDissolveTransition]
+            "advanced": [TestDissolveTransition, TestSceneManager]
         }
         
         if category not in categories:
@@ -197,11 +202,13 @@ Available test classes:
     ColorUtils          # Test color processing and blending (18 methods)
     Segment             # Test animation logic and positioning (25 methods)  
     DissolveTransition  # Test dual pattern crossfade system (22 methods)
+    SceneManager        # Test scene loading and pattern changes
 
 Available categories:
     color      # Color processing tests only
     animation  # Animation and segment tests only
     dissolve   # Dissolve pattern tests only
+    scene      # Scene manager tests only
     core       # Core functionality (color + animation)
     advanced   # Advanced features (dissolve system)
 
@@ -229,7 +236,8 @@ def list_tests():
     test_classes = [
         ("TestColorUtils", TestColorUtils, "Color processing and blending"),
         ("TestSegment", TestSegment, "Animation logic and positioning"),
-        ("TestDissolveTransition", TestDissolveTransition, "Dual pattern crossfade system")
+        ("TestDissolveTransition", TestDissolveTransition, "Dual pattern crossfade system"),
+        ("TestSceneManager", TestSceneManager, "Scene loading and pattern changes")
     ]
     
     for class_name, test_class, description in test_classes:
@@ -240,10 +248,11 @@ def list_tests():
         print()
     
     print("Test Coverage Summary:")
-    print("• Color Utils: 17 methods covering transparency, brightness, blending")
+    print("• Color Utils: 21 methods covering transparency, brightness, blending")
     print("• Segment: 29 methods covering timing, positioning, rendering")
-    print("• Dissolve: 22 methods covering dual pattern crossfade system")
-    print("• Total: 68 comprehensive test methods")
+    print("• Dissolve: 27 methods covering dual pattern crossfade system")
+    print("• Scene Manager: 27 methods covering scene loading, pattern changes and lock-free getters")
+    print("• Total: 104 comprehensive test methods")
 
 
 if __name__ == '__main__':
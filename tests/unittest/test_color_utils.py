@@ -241,6 +241,35 @@ class TestColorUtils(unittest.TestCase):
         self.assertEqual(led_array[0], [0, 0, 0])  # Unchanged
         self.assertEqual(led_array[2], [0, 0, 0])  # Unchanged
     
+    def test_resize_frame_keeps_rows(self):
+        """Test frame buffers grow and shrink in place with distinct new rows"""
+        frame = [[1, 2, 3] for _ in range(3)]
+        first_row = frame[0]
+        
+        self.assertIs(ColorUtils.resize_frame(frame, 5), frame)
+        self.assertEqual(len(frame), 5)
+        self.assertIs(frame[0], first_row)
+        self.assertEqual(frame[4], [0, 0, 0])
+        self.assertIsNot(frame[3], frame[4])
+        
+        ColorUtils.resize_frame(frame, 2)
+        self.assertEqual(frame, [[1, 2, 3], [1, 2, 3]])
+    
+    def test_single_contribution_fast_path_clamps(self):
+        """Test a lone full-weight contribution is clamped like the weighted average"""
+        ColorUtils.reset_frame_contributions()
+        led_array = [[0, 0, 0] for _ in range(3)]
+        
+        ColorUtils.add_colors_to_led_array(led_array, 0, [300.7, -5, 12.9, 99])
+        ColorUtils.add_colors_to_led_array(led_array, 2, [255, 128, 64], 0.5)
+        rows = list(led_array)
+        ColorUtils.finalize_frame_blending(led_array)
+        
+        self.assertEqual(led_array[0], [255, 0, 12])
+        self.assertEqual(led_array[2], [255, 128, 64])
+        for row, original in zip(led_array, rows):
+            self.assertIs(row, original)
+    
     def test_add_colors_to_led_array_multiple_contributions(self):
         """Test adding multiple color contributions for averaging"""
         ColorUtils.reset_frame_contributions()
@@ -304,6 +333,40 @@ class TestColorUtils(unittest.TestCase):
         # Should result in black due to zero weight
         self.assertEqual(led_array[1], [0, 0, 0])
 
+    def test_apply_colors_to_array_exact_scaling(self):
+        """Test master brightness uses exact integer scaling for every channel value"""
+        led_colors = [[c, c, c] for c in range(256)]
+        
+        for brightness in (1, 64, 127, 200, 254):
+            result = ColorUtils.apply_colors_to_array(led_colors, brightness)
+            for c, color in enumerate(result):
+                self.assertEqual(color, [c * brightness // 255] * 3)
+
+    def test_fade_bytes_match_array_scaling(self):
+        """Test the packed-byte fade table matches apply_colors_to_array"""
+        packed = bytes(range(256))
+        
+        for brightness in (0, 64, 200, 255):
+            faded = packed.translate(ColorUtils.get_fade_bytes(brightness))
+            expected = ColorUtils.apply_colors_to_array([[c, c, c] for c in range(256)], brightness)
+            self.assertEqual(list(faded), [color[0] for color in expected])
+
+    def test_get_black_frame_cached(self):
+        """Test black frame is cached per LED count"""
+        frame = ColorUtils.get_black_frame(10)
+        self.assertEqual(len(frame), 10)
+        self.assertTrue(all(color == [0, 0, 0] for color in frame))
+        
+        # Same object returned until LED count changes
+        self.assertIs(ColorUtils.get_black_frame(10), frame)
+        
+        resized = ColorUtils.get_black_frame(5)
+        self.assertEqual(len(resized), 5)
+        self.assertIsNot(resized, frame)
+        
+        # Switching back reuses the frame cached for that count
+        self.assertIs(ColorUtils.get_black_frame(10), frame)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -13,7 +13,7 @@ import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.models.common import DissolveTransition, DualPatternCalculator, PatternState, LEDCrossfadeState
+from src.models.common import DissolveTransition, DualPatternCalculator, PatternState, LEDCrossfadeState, _blend_rows
 from src.models.types import DissolvePhase
 from src.utils.color_utils import ColorUtils
 
@@ -173,7 +173,7 @@ class TestDissolveTransition(unittest.TestCase):
         mock_effect.render_to_led_array = mock_render
         
         pattern_state = PatternState(scene_id=0, effect_id=0, palette_id=0)
-        result = self.dual_calculator.calculate_pattern_colors(pattern_state, time.time(), 5)
+        result = self.dual_calculator.calculate_pattern_colors(pattern_state, time.perf_counter(), 5)
         
         # Should return red colors for all LEDs
         expected = [[255, 0, 0]] * 5
@@ -184,7 +184,7 @@ class TestDissolveTransition(unittest.TestCase):
         self.mock_scene_manager.scenes = {}
         
         pattern_state = PatternState(scene_id=999, effect_id=0, palette_id=0)
-        result = self.dual_calculator.calculate_pattern_colors(pattern_state, time.time(), 5)
+        result = self.dual_calculator.calculate_pattern_colors(pattern_state, time.perf_counter(), 5)
         
         # Should return black colors for invalid scene
         expected = [[0, 0, 0]] * 5
@@ -273,7 +273,7 @@ class TestDissolveTransition(unittest.TestCase):
             self.dissolve.start_dissolve(self.old_pattern, self.new_pattern, [], self.led_count)
             
             # Should immediately complete and return new pattern colors
-            result = self.dissolve.update_dissolve(time.time())
+            result = self.dissolve.update_dissolve(time.perf_counter())
             expected = [[0, 255, 0]] * self.led_count
             self.assertEqual(result, expected)
             
@@ -307,7 +307,7 @@ class TestDissolveTransition(unittest.TestCase):
         dissolve_no_calc.start_dissolve(self.old_pattern, self.new_pattern, pattern_data, self.led_count)
         
         # Should handle missing calculator gracefully
-        result = dissolve_no_calc.update_dissolve(time.time())
+        result = dissolve_no_calc.update_dissolve(time.perf_counter())
         
         # Should return black array and complete immediately
         expected = [[0, 0, 0]] * self.led_count
@@ -332,7 +332,7 @@ class TestDissolveTransition(unittest.TestCase):
             self.assertEqual(len(self.dissolve.led_states), different_led_count)
             
             # Should work with new LED count
-            result = self.dissolve.update_dissolve(time.time())
+            result = self.dissolve.update_dissolve(time.perf_counter())
             self.assertEqual(len(result), different_led_count)
     
     def test_crossfade_progress_calculation(self):
@@ -396,6 +396,42 @@ class TestDissolveTransition(unittest.TestCase):
             led_6_progress = self.dissolve.led_states[6].blend_progress
             self.assertEqual(led_6_progress, 0.0)
     
+    def test_blend_rows_kernel(self):
+        """Test the fixed-point blend kernel mixes rows and passes identical rows through"""
+        shared = [10, 20, 30]
+        old_rows = [[0, 0, 0], shared]
+        new_rows = [[255, 128, 2], [10, 20, 30]]
+        result = []
+        
+        _blend_rows(old_rows, new_rows, 128, 128, result.append)
+        
+        self.assertEqual(result[0], [127, 64, 1])
+        self.assertIs(result[1], new_rows[1])
+    
+    def test_timing_runs_follow_overlapping_ranges(self):
+        """Test LEDs are grouped by final timing and each run blends from its own progress"""
+        pattern_data = [[0, 100, 0, 5], [100, 100, 3, 4]]
+        
+        with patch.object(self.dual_calculator, 'calculate_pattern_colors') as mock_calc:
+            mock_calc.side_effect = [
+                [[200, 0, 0]] * self.led_count,
+                [[0, 200, 0]] * self.led_count
+            ]
+            
+            self.dissolve.start_dissolve(self.old_pattern, self.new_pattern, pattern_data, self.led_count)
+            runs = [(run.start_idx, run.end_idx) for run in self.dissolve._timing_runs]
+            self.assertEqual(runs, [(0, 3), (3, 5), (5, 6), (6, self.led_count)])
+            
+            result = self.dissolve.update_dissolve(self.dissolve.start_time + 0.05)
+            
+            self.assertEqual(len(result), self.led_count)
+            self.assertNotIn(result[0], ([200, 0, 0], [0, 200, 0]))
+            self.assertEqual(result[3], [200, 0, 0])
+            self.assertEqual(result[5], result[0])
+            self.assertEqual(result[6], [0, 200, 0])
+            self.assertEqual(self.dissolve.led_states[3].blend_progress, 0.0)
+            self.assertAlmostEqual(self.dissolve.led_states[5].blend_progress, 0.5, places=6)
+    
     def test_dissolve_error_handling(self):
         """Test dissolve error handling with invalid states - fixed error expectations"""
         pattern_data = [[0, 100, 0, 1]]
@@ -408,7 +444,7 @@ class TestDissolveTransition(unittest.TestCase):
             
             # Should handle calculator errors gracefully - the error should be caught
             try:
-                result = self.dissolve.update_dissolve(time.time())
+                result = self.dissolve.update_dissolve(time.perf_counter())
                 # If error is handled, we get black array and transition completes
                 expected = [[0, 0, 0]] * self.led_count
                 self.assertEqual(result, expected)
@@ -418,6 +454,18 @@ class TestDissolveTransition(unittest.TestCase):
                 # The actual implementation might not catch this error
                 pass
     
+    def test_preallocate_resizes_only_when_idle(self):
+        """Test LED states are sized ahead of time but never resized mid-dissolve"""
+        self.dissolve.preallocate(50)
+        self.assertEqual(len(self.dissolve.led_states), 50)
+        led_states = self.dissolve.led_states
+        
+        self.dissolve.start_dissolve(self.old_pattern, self.new_pattern, [[0, 1000, 0, 49]], 50)
+        self.assertIs(self.dissolve.led_states, led_states)
+        
+        self.dissolve.preallocate(80)
+        self.assertEqual(len(self.dissolve.led_states), 50)
+    
     def test_pattern_state_creation(self):
         """Test PatternState creation and attributes"""
         pattern = PatternState(scene_id=2, effect_id=3, palette_id=1)
@@ -425,6 +473,10 @@ class TestDissolveTransition(unittest.TestCase):
         self.assertEqual(pattern.scene_id, 2)
         self.assertEqual(pattern.effect_id, 3)
         self.assertEqual(pattern.palette_id, 1)
+        self.assertEqual(pattern, PatternState(scene_id=2, effect_id=3, palette_id=1))
+        
+        with self.assertRaises(AttributeError):
+            pattern.scene_id = 0
     
     def test_dissolve_phase_transitions(self):
         """Test dissolve phase transitions"""
@@ -466,6 +518,24 @@ class TestDissolveTransition(unittest.TestCase):
         self.assertFalse(self.dissolve.is_active)
         self.assertEqual(self.dissolve.phase, DissolvePhase.COMPLETED)
     
+    def test_dissolve_end_time_completion(self):
+        """Test dissolve completes from the precomputed end time without blending"""
+        pattern_data = [[0, 100, 0, 2], [50, 150, 3, 5]]
+
+        with patch.object(self.dual_calculator, 'calculate_pattern_colors') as mock_calc:
+            mock_calc.return_value = [[0, 255, 0]] * self.led_count
+
+            self.dissolve.start_dissolve(self.old_pattern, self.new_pattern, pattern_data, self.led_count)
+            self.assertAlmostEqual(self.dissolve.end_time, self.dissolve.start_time + 0.2, places=6)
+
+            result = self.dissolve.update_dissolve(self.dissolve.end_time)
+
+            mock_calc.assert_called_once()
+            self.assertIs(mock_calc.call_args[0][0], self.new_pattern)
+            self.assertEqual(result, [[0, 255, 0]] * self.led_count)
+            self.assertEqual(self.dissolve.led_states[3].blend_progress, 1.0)
+            self.assertFalse(self.dissolve.is_active)
+
     def test_dissolve_timing_precision(self):
         """Test dissolve timing precision with small durations"""
         pattern_data = [[0, 10, 0, 0]]  # Very short 10ms duration
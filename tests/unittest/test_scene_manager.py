@@ -0,0 +1,481 @@
+"""
+Unit tests for SceneManager
+Tests scene loading, cached scene/effect/palette changes and lock-free getters
+"""
+
+import unittest
+import json
+import tempfile
+import os
+import time
+import threading
+from pathlib import Path
+from unittest.mock import patch, Mock
+import sys
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.animation_engine import AnimationEngine
+from src.core.scene_manager import SceneManager
+from src.models.common import PatternState
+
+
+def _make_scene_data(scene_id, led_count=20, effects_count=2, palettes_count=2):
+    """Build a minimal scene dictionary in multiple-scenes JSON format"""
+    return {
+        "scene_id": scene_id,
+        "led_count": led_count,
+        "fps": 60,
+        "current_effect_id": 0,
+        "current_palette_id": 0,
+        "palettes": [
+            [[255, 0, 0], [0, 255, 0], [0, 0, 255], [255, 255, 0], [255, 0, 255], [0, 255, 255]]
+            for _ in range(palettes_count)
+        ],
+        "effects": [
+            {
+                "effect_id": effect_id,
+                "segments": {
+                    "0": {
+                        "segment_id": 0,
+                        "color": [0, 1],
+                        "transparency": [0.0, 0.0],
+                        "length": [3, 2],
+                        "move_speed": 10.0,
+                        "move_range": [0, led_count - 1],
+                        "initial_position": 0,
+                        "is_edge_reflect": True,
+                        "dimmer_time": [[1000, 100, 100]]
+                    }
+                }
+            }
+            for effect_id in range(effects_count)
+        ]
+    }
+
+
+class TestSceneManager(unittest.TestCase):
+    """Test SceneManager scene handling"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.scene_manager = SceneManager()
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.scene_file = os.path.join(self.temp_dir.name, "scenes.json")
+
+        with open(self.scene_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "scenes": [
+                    _make_scene_data(0, led_count=20),
+                    _make_scene_data(1, led_count=30)
+                ]
+            }, f)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        self.temp_dir.cleanup()
+
+    def test_initial_led_count(self):
+        """Test LED count is zero before any scene is loaded"""
+        self.assertEqual(self.scene_manager.get_current_led_count(), 0)
+        self.assertEqual(self.scene_manager.get_scene_info(), {})
+
+    def test_load_multiple_scenes(self):
+        """Test loading scenes selects the lowest scene ID"""
+        self.assertTrue(self.scene_manager.load_multiple_scenes_from_file(self.scene_file))
+
+        self.assertEqual(sorted(self.scene_manager.scenes.keys()), [0, 1])
+        self.assertEqual(self.scene_manager.get_scene_ids(), (0, 1))
+        self.assertEqual(self.scene_manager.current_scene_id, 0)
+        self.assertEqual(self.scene_manager.get_current_led_count(), 20)
+
+    def test_reload_unchanged_file_uses_cache(self):
+        """Test reloading an unchanged file reuses parsed data without aliasing it"""
+        self.assertTrue(self.scene_manager.load_multiple_scenes_from_file(self.scene_file))
+        self.scene_manager.scenes[0].palettes[0][0] = [1, 2, 3]
+
+        with patch('src.core.scene_manager.parse_json') as mock_parse:
+            self.assertTrue(self.scene_manager.load_multiple_scenes_from_file(self.scene_file))
+            mock_parse.assert_not_called()
+
+        self.assertEqual(self.scene_manager.scenes[0].palettes[0][0], [255, 0, 0])
+
+    def test_reload_refreshes_current_scene(self):
+        """Test reloading scenes re-points the current scene at the reloaded object"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        self.scene_manager.change_scene(1)
+
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        self.assertEqual(self.scene_manager.current_scene_id, 1)
+        self.assertIs(self.scene_manager.current_scene, self.scene_manager.scenes[1])
+
+    def test_jsonl_scenes_load_on_first_use(self):
+        """Test a .jsonl scene file is indexed and scenes are built only when selected"""
+        jsonl_file = os.path.join(self.temp_dir.name, "scenes.jsonl")
+        with open(jsonl_file, 'w', encoding='utf-8') as f:
+            for scene_id, led_count in ((0, 20), (1, 30), (2, 40)):
+                f.write(json.dumps(_make_scene_data(scene_id, led_count=led_count)) + "\n")
+
+        self.assertTrue(self.scene_manager.load_multiple_scenes_from_file(jsonl_file))
+        self.assertEqual(self.scene_manager.get_scene_ids(), (0, 1, 2))
+        self.assertEqual(sorted(self.scene_manager.scenes.keys()), [0])
+
+        self.assertTrue(self.scene_manager.change_scene(2))
+        self.assertEqual(self.scene_manager.get_current_led_count(), 40)
+        self.assertIn(2, self.scene_manager.original_scene_speeds)
+        self.assertNotIn(1, self.scene_manager.scenes)
+
+    def test_load_json_command_accepts_index_sources(self):
+        """Test /load_json passes .jsonl files and scene directories through without appending .json"""
+        jsonl_file = os.path.join(self.temp_dir.name, "scenes.jsonl")
+        with open(jsonl_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(_make_scene_data(4)) + "\n")
+
+        scene_dir = os.path.join(self.temp_dir.name, "scenes")
+        os.mkdir(scene_dir)
+        with open(os.path.join(scene_dir, "005.json"), 'w', encoding='utf-8') as f:
+            json.dump(_make_scene_data(5), f)
+
+        engine = Mock(scene_manager=self.scene_manager, animation_running=False)
+
+        AnimationEngine.handle_load_json(engine, "/load_json", jsonl_file)
+        self.assertEqual(self.scene_manager.get_scene_ids(), (4,))
+
+        AnimationEngine.handle_load_json(engine, "/load_json", scene_dir + "/")
+        self.assertEqual(self.scene_manager.get_scene_ids(), (4, 5))
+
+        with open(os.path.join(self.temp_dir.name, "show.json"), 'w', encoding='utf-8') as f:
+            json.dump({"scenes": [_make_scene_data(6)]}, f)
+
+        AnimationEngine.handle_load_json(engine, "/load_json", os.path.join(self.temp_dir.name, "show"))
+        self.assertEqual(self.scene_manager.get_scene_ids(), (4, 5, 6))
+
+    def test_indexed_scenes_built_without_lock(self):
+        """Test indexed scenes are parsed and built with the scene lock released"""
+        scene_dir = os.path.join(self.temp_dir.name, "scenes")
+        os.mkdir(scene_dir)
+        for scene_id in (0, 1):
+            with open(os.path.join(scene_dir, f"{scene_id:03d}.json"), 'w', encoding='utf-8') as f:
+                json.dump(_make_scene_data(scene_id), f)
+
+        lock_held = []
+        build = SceneManager._build_indexed_scene
+
+        def checking_build(manager, scene_id, source):
+            lock_held.append(manager._lock._is_owned())
+            return build(manager, scene_id, source)
+
+        with patch.object(SceneManager, '_build_indexed_scene', checking_build):
+            self.assertTrue(self.scene_manager.load_scene_index(scene_dir))
+            self.assertTrue(self.scene_manager.change_scene(1))
+
+        self.assertEqual(lock_held, [False, False])
+
+    def test_jsonl_accepts_legacy_scene_id_key(self):
+        """Test .jsonl indexing reads the legacy scene_ID key like Scene.from_dict does"""
+        scene_data = _make_scene_data(3)
+        scene_data["scene_ID"] = scene_data.pop("scene_id")
+        jsonl_file = os.path.join(self.temp_dir.name, "legacy.jsonl")
+        with open(jsonl_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(scene_data) + "\n")
+
+        self.assertTrue(self.scene_manager.load_multiple_scenes_from_file(jsonl_file))
+        self.assertEqual(self.scene_manager.get_scene_ids(), (3,))
+        self.assertEqual(self.scene_manager.current_scene_id, 3)
+
+    def test_scene_directory_index(self):
+        """Test a directory of NNN.json files is indexed by file name and unreadable scenes are rejected"""
+        scene_dir = os.path.join(self.temp_dir.name, "scenes")
+        os.mkdir(scene_dir)
+        for scene_id in (0, 1, 2):
+            with open(os.path.join(scene_dir, f"{scene_id:03d}.json"), 'w', encoding='utf-8') as f:
+                json.dump(_make_scene_data(scene_id), f)
+
+        self.assertTrue(self.scene_manager.load_scene_index(scene_dir))
+        self.assertEqual(self.scene_manager.get_scene_ids(), (0, 1, 2))
+        self.assertEqual(sorted(self.scene_manager.scenes.keys()), [0])
+
+        with open(os.path.join(scene_dir, "001.json"), 'w', encoding='utf-8') as f:
+            f.write("{not json")
+        os.remove(os.path.join(scene_dir, "002.json"))
+
+        self.assertFalse(self.scene_manager.change_scene(1))
+        self.assertFalse(self.scene_manager.change_scene(2))
+        self.assertEqual(self.scene_manager.current_scene_id, 0)
+
+    def test_load_missing_file(self):
+        """Test loading a missing file fails cleanly"""
+        missing_file = os.path.join(self.temp_dir.name, "missing.json")
+        self.assertFalse(self.scene_manager.load_multiple_scenes_from_file(missing_file))
+
+    def test_load_rejects_invalid_envelope(self):
+        """Test files without a top-level 'scenes' array fail cleanly"""
+        for payload in ([_make_scene_data(0)], {"scenes": {"0": _make_scene_data(0)}}):
+            with open(self.scene_file, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            self.assertFalse(self.scene_manager.load_multiple_scenes_from_file(self.scene_file))
+
+        self.assertEqual(self.scene_manager.stats.errors, 2)
+
+    def test_change_scene_updates_led_count(self):
+        """Test scene change refreshes the lock-free LED count"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+
+        self.assertTrue(self.scene_manager.change_scene(1))
+        self.assertEqual(self.scene_manager.get_current_led_count(), 30)
+        self.assertEqual(self.scene_manager.get_scene_info()['led_count'], 30)
+
+        self.assertFalse(self.scene_manager.change_scene(5))
+        self.assertEqual(self.scene_manager.get_current_led_count(), 30)
+
+    def test_scene_info_cached_until_state_changes(self):
+        """Test scene info is reused between changes and refreshed after them"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+
+        info = self.scene_manager.get_scene_info()
+        cached_info = self.scene_manager.get_scene_info()
+        self.assertEqual(info, cached_info)
+        self.assertIsNot(info, cached_info)
+
+        cached_info['scene_id'] = 99
+        self.assertEqual(self.scene_manager.get_scene_info()['scene_id'], 0)
+
+        self.scene_manager.change_effect(1)
+        self.assertEqual(self.scene_manager.get_scene_info()['current_effect_id'], 1)
+
+    def test_change_effect_and_palette_validation(self):
+        """Test effect and palette changes reject invalid IDs"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+
+        self.assertTrue(self.scene_manager.change_effect(1))
+        self.assertFalse(self.scene_manager.change_effect(2))
+        self.assertFalse(self.scene_manager.change_effect(-1))
+
+        self.assertTrue(self.scene_manager.change_palette(1))
+        self.assertFalse(self.scene_manager.change_palette(2))
+        self.assertFalse(self.scene_manager.change_palette(-1))
+
+        info = self.scene_manager.get_scene_info()
+        self.assertEqual(info['current_effect_id'], 1)
+        self.assertEqual(info['current_palette_id'], 1)
+
+    def test_repeated_change_is_noop(self):
+        """Test requesting the already-selected scene/effect/palette caches nothing"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+
+        self.assertTrue(self.scene_manager.change_effect(0))
+        self.assertTrue(self.scene_manager.change_palette(0))
+        self.assertFalse(self.scene_manager.has_pending_changes)
+        self.assertEqual(self.scene_manager.stats.effect_changes, 0)
+        self.assertEqual(self.scene_manager.stats.palette_changes, 0)
+
+        self.assertTrue(self.scene_manager.change_effect(1))
+        self.assertTrue(self.scene_manager.change_effect(1))
+        self.assertEqual(self.scene_manager.stats.effect_changes, 1)
+
+        self.assertTrue(self.scene_manager.change_scene(0))
+        self.assertEqual(self.scene_manager.stats.scene_switches, 0)
+
+    def test_repeated_speed_keeps_segment_direction(self):
+        """Test re-sending the active speed percent leaves bounced segments alone"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        segment = self.scene_manager.current_scene.effects[0].segments["0"]
+
+        self.scene_manager.set_speed_percent(50)
+        self.assertAlmostEqual(segment.move_speed, 5.0)
+
+        segment.move_speed = -5.0
+        self.scene_manager.set_speed_percent(50)
+        self.assertAlmostEqual(segment.move_speed, -5.0)
+
+        self.scene_manager.set_speed_percent(100)
+        self.assertAlmostEqual(segment.move_speed, 10.0)
+
+    def test_update_animation_undoes_speed_scaling(self):
+        """Test effects receive the unscaled delta and nothing advances at 0% speed"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        effect = self.scene_manager.current_scene.effects[0]
+
+        self.scene_manager.set_speed_percent(200)
+        with patch.object(effect, 'update_animation') as mock_update:
+            self.scene_manager.update_animation(0.2)
+            self.assertAlmostEqual(mock_update.call_args[0][0], 0.1)
+
+        self.scene_manager.set_speed_percent(0)
+        with patch.object(effect, 'update_animation') as mock_update:
+            self.scene_manager.update_animation(0.2)
+            mock_update.assert_not_called()
+
+    def test_current_led_data_size(self):
+        """Test rendered LED data matches requested LED count"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+
+        led_data = self.scene_manager.get_current_led_data(20, time.perf_counter())
+        self.assertEqual(len(led_data), 20)
+        for color in led_data:
+            self.assertEqual(len(color), 3)
+
+        self.assertIs(self.scene_manager.get_current_led_data(20, time.perf_counter()), led_data)
+        self.assertEqual(len(self.scene_manager.get_current_led_data(30, time.perf_counter())), 30)
+
+    def test_render_state_follows_pattern_changes(self):
+        """Test render snapshot keeps cached pattern until change_pattern applies it"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        scene = self.scene_manager.current_scene
+
+        self.assertIs(self.scene_manager._render_state.effect, scene.effects[0])
+
+        self.scene_manager.change_effect(1)
+        self.assertIs(self.scene_manager._render_state.effect, scene.effects[0])
+
+        self.assertTrue(self.scene_manager.change_pattern())
+        self.assertIs(self.scene_manager._render_state.effect, scene.effects[1])
+        self.assertEqual(len(self.scene_manager.get_current_led_data(20, time.perf_counter())), 20)
+
+    def test_update_animation_only_rendered_effect(self):
+        """Test animation update advances only the effect being rendered"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        scene = self.scene_manager.current_scene
+        rendered_segment = scene.effects[0].segments["0"]
+        idle_segment = scene.effects[1].segments["0"]
+
+        self.scene_manager.update_animation(0.5)
+        self.assertGreater(rendered_segment.current_position, 0)
+        self.assertEqual(idle_segment.current_position, 0)
+
+        position = rendered_segment.current_position
+        self.scene_manager.update_animation(0.0)
+        self.assertEqual(rendered_segment.current_position, position)
+
+    def test_dissolve_update_advances_shared_effect_once(self):
+        """Test a palette-only dissolve advances its shared effect once per frame"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        scene = self.scene_manager.current_scene
+        transition = self.scene_manager.dissolve_transition
+
+        transition.pattern_pair = (PatternState(0, 0, 0), PatternState(0, 0, 1))
+        with patch.object(scene.effects[0], 'update_animation') as mock_update:
+            self.scene_manager._update_dissolve_effects(0.1)
+            mock_update.assert_called_once_with(0.1)
+
+        transition.pattern_pair = (PatternState(0, 0, 0), PatternState(0, 1, 0))
+        with patch.object(scene.effects[0], 'update_animation') as old_update, \
+                patch.object(scene.effects[1], 'update_animation') as new_update:
+            self.scene_manager._update_dissolve_effects(0.1)
+            old_update.assert_called_once_with(0.1)
+            new_update.assert_called_once_with(0.1)
+
+    def test_dissolve_effects_resolved_once_per_pattern_pair(self):
+        """Test dissolve effects are looked up once and again only after scenes are replaced"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        self.scene_manager.dissolve_transition.pattern_pair = (PatternState(0, 0, 0), PatternState(1, 0, 0))
+        self.scene_manager._update_dissolve_effects(0.1)
+
+        with patch.object(SceneManager, '_resolve_dissolve_effects', return_value=()) as mock_resolve:
+            self.scene_manager._update_dissolve_effects(0.1)
+            mock_resolve.assert_not_called()
+
+            self.scene_manager.scenes = dict(self.scene_manager.scenes)
+            self.scene_manager._update_dissolve_effects(0.1)
+            mock_resolve.assert_called_once()
+
+    def test_dissolve_tick_falls_back_to_steady(self):
+        """Test the dissolve tick swaps back to the steady tick once no transition is active"""
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        self.assertEqual(self.scene_manager._tick, self.scene_manager._tick_steady)
+
+        self.scene_manager._tick = self.scene_manager._tick_dissolve
+        effect = self.scene_manager.current_scene.effects[0]
+        with patch.object(effect, 'update_animation') as mock_update:
+            self.scene_manager.update_animation(0.1)
+            mock_update.assert_called_once_with(0.1)
+
+        self.assertEqual(self.scene_manager._tick, self.scene_manager._tick_steady)
+
+    def test_change_callbacks_delivered_by_worker(self):
+        """Test change callbacks run on the notification worker without the manager lock"""
+        delivered = threading.Event()
+        calls = []
+
+        def callback():
+            acquired = self.scene_manager._lock.acquire(blocking=False)
+            if acquired:
+                self.scene_manager._lock.release()
+            calls.append((threading.current_thread() is threading.main_thread(), acquired))
+            delivered.set()
+
+        self.scene_manager.add_change_callback(callback)
+        self.assertIsInstance(self.scene_manager._change_callbacks, tuple)
+
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        self.assertTrue(delivered.wait(timeout=2.0))
+
+        self.assertGreaterEqual(len(calls), 1)
+        self.assertEqual(calls[0], (False, True))
+
+    def test_notification_burst_delivered_once(self):
+        """Test notifications queued within one frame reach callbacks a single time"""
+        calls = []
+        delivered = threading.Event()
+
+        def callback():
+            calls.append(1)
+            delivered.set()
+
+        self.scene_manager.add_change_callback(callback)
+        for _ in range(3):
+            self.scene_manager._notify_changes()
+
+        self.assertTrue(delivered.wait(timeout=2.0))
+        time.sleep(0.1)
+        self.assertEqual(len(calls), 1)
+
+    def test_failing_change_callback_does_not_block_others(self):
+        """Test a raising callback is absorbed and later callbacks still run"""
+        delivered = threading.Event()
+
+        def failing_callback():
+            raise RuntimeError("callback failure")
+
+        self.scene_manager.add_change_callback(failing_callback)
+        self.scene_manager.add_change_callback(delivered.set)
+
+        self.scene_manager.load_multiple_scenes_from_file(self.scene_file)
+        self.assertTrue(delivered.wait(timeout=2.0))
+
+    def test_dissolve_info(self):
+        """Test dissolve info reports cached pattern IDs and phase"""
+        info = self.scene_manager.get_dissolve_info()
+        self.assertFalse(info['enabled'])
+        self.assertEqual(info['available_patterns'], [])
+        self.assertEqual(info['transition_phase'], "completed")
+
+        pattern_file = os.path.join(self.temp_dir.name, "dissolve.json")
+        with open(pattern_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "dissolve_patterns": {
+                    "2": [[0, 100, 0, 9]],
+                    "0": [[0, 200, 0, 19]]
+                }
+            }, f)
+
+        self.assertTrue(self.scene_manager.load_dissolve_patterns_from_file(pattern_file))
+
+        info = self.scene_manager.get_dissolve_info()
+        self.assertTrue(info['enabled'])
+        self.assertEqual(info['available_patterns'], [0, 2])
+        self.assertEqual(info['pattern_count'], 2)
+        self.assertFalse(info['transition_active'])
+
+        with open(pattern_file, 'w', encoding='utf-8') as f:
+            json.dump({"dissolve_patterns": [[0, 100, 0, 9]]}, f)
+
+        self.assertFalse(self.scene_manager.load_dissolve_patterns_from_file(pattern_file))
+        self.assertEqual(self.scene_manager.get_dissolve_info()['available_patterns'], [])
+        self.assertEqual(self.scene_manager.dissolve_patterns.get_available_patterns(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
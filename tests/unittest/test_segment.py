@@ -168,7 +168,7 @@ class TestSegment(unittest.TestCase):
         )
         
         with patch.object(segment, 'get_brightness_at_time', return_value=1.0):
-            colors = segment.get_led_colors_with_timing(self.sample_palette, time.time())
+            colors = segment.get_led_colors_with_timing(self.sample_palette, time.perf_counter())
             
             # Should have 6 LEDs total (2+2+2)
             self.assertEqual(len(colors), 6)
@@ -197,7 +197,7 @@ class TestSegment(unittest.TestCase):
         
         # Mock brightness to return 0.5
         with patch.object(segment, 'get_brightness_at_time', return_value=0.5):
-            colors = segment.get_led_colors_with_timing(self.sample_palette, time.time())
+            colors = segment.get_led_colors_with_timing(self.sample_palette, time.perf_counter())
             
             # Should have 3 LEDs with 50% brightness
             self.assertEqual(len(colors), 3)
@@ -215,7 +215,7 @@ class TestSegment(unittest.TestCase):
         
         # Mock brightness to return 0.0
         with patch.object(segment, 'get_brightness_at_time', return_value=0.0):
-            colors = segment.get_led_colors_with_timing(self.sample_palette, time.time())
+            colors = segment.get_led_colors_with_timing(self.sample_palette, time.perf_counter())
             
             # Should return empty array when brightness is 0
             self.assertEqual(colors, [])
@@ -230,7 +230,7 @@ class TestSegment(unittest.TestCase):
         )
         
         with patch.object(segment, 'get_brightness_at_time', return_value=1.0):
-            colors = segment.get_led_colors_with_timing(self.sample_palette, time.time())
+            colors = segment.get_led_colors_with_timing(self.sample_palette, time.perf_counter())
             
             # Should have 3 LEDs
             self.assertEqual(len(colors), 3)
@@ -252,7 +252,7 @@ class TestSegment(unittest.TestCase):
         )
         
         with patch.object(segment, 'get_brightness_at_time', return_value=1.0):
-            colors = segment.get_led_colors_with_timing(self.sample_palette, time.time())
+            colors = segment.get_led_colors_with_timing(self.sample_palette, time.perf_counter())
             
             # Should have 6 LEDs: 2+2 from length array + 2 extra colors
             self.assertEqual(len(colors), 6)
@@ -343,17 +343,16 @@ class TestSegment(unittest.TestCase):
         led_array = [[0, 0, 0] for _ in range(10)]
         
         with patch.object(segment, 'get_led_colors_with_timing', return_value=[[100, 50, 25], [100, 50, 25], [100, 50, 25]]):
-            with patch.object(ColorUtils, 'validate_rgb_color', side_effect=lambda x: x[:3]):
-                with patch.object(ColorUtils, 'add_colors_to_led_array') as mock_add:
-                    segment.render_to_led_array(self.sample_palette, time.time(), led_array)
-                    
-                    self.assertEqual(mock_add.call_count, 3)
-                    expected_calls = [
-                        unittest.mock.call(led_array, 2, [100, 50, 25]), 
-                        unittest.mock.call(led_array, 3, [100, 50, 25]),
-                        unittest.mock.call(led_array, 4, [100, 50, 25])
-                    ]
-                    mock_add.assert_has_calls(expected_calls)    
+            with patch.object(ColorUtils, 'add_colors_to_led_array') as mock_add:
+                segment.render_to_led_array(self.sample_palette, time.perf_counter(), led_array)
+                
+                self.assertEqual(mock_add.call_count, 3)
+                expected_calls = [
+                    unittest.mock.call(led_array, 2, [100, 50, 25]), 
+                    unittest.mock.call(led_array, 3, [100, 50, 25]),
+                    unittest.mock.call(led_array, 4, [100, 50, 25])
+                ]
+                mock_add.assert_has_calls(expected_calls)    
 
     def test_render_to_led_array_out_of_bounds(self):
         """Test rendering with out-of-bounds position"""
@@ -369,15 +368,14 @@ class TestSegment(unittest.TestCase):
         led_array = [[0, 0, 0] for _ in range(10)]
         
         with patch.object(segment, 'get_led_colors_with_timing', return_value=[[100, 50, 25]] * 5):
-            with patch.object(ColorUtils, 'validate_rgb_color', side_effect=lambda x: x[:3]):
-                with patch.object(ColorUtils, 'add_colors_to_led_array') as mock_add:
-                    segment.render_to_led_array(self.sample_palette, time.time(), led_array)
-                    
-                    # The actual implementation applies range clamping and might render more LEDs
-                    # Just check that some rendering happened and didn't crash
-                    self.assertGreaterEqual(mock_add.call_count, 2)
-                    self.assertLessEqual(mock_add.call_count, 5)  # Should not exceed segment length
-    
+            with patch.object(ColorUtils, 'add_colors_to_led_array') as mock_add:
+                segment.render_to_led_array(self.sample_palette, time.perf_counter(), led_array)
+                
+                # The actual implementation applies range clamping and might render more LEDs
+                # Just check that some rendering happened and didn't crash
+                self.assertGreaterEqual(mock_add.call_count, 2)
+                self.assertLessEqual(mock_add.call_count, 5)  # Should not exceed segment length
+
     def test_render_to_led_array_negative_position(self):
         """Test rendering with negative position"""
         segment = Segment(
@@ -391,19 +389,18 @@ class TestSegment(unittest.TestCase):
         led_array = [[0, 0, 0] for _ in range(10)]
         
         with patch.object(segment, 'get_led_colors_with_timing', return_value=[[100, 50, 25]] * 5):
-            with patch.object(ColorUtils, 'validate_rgb_color', side_effect=lambda x: x[:3]):
-                with patch.object(ColorUtils, 'add_colors_to_led_array') as mock_add:
-                    segment.render_to_led_array(self.sample_palette, time.time(), led_array)
-                    
-                    # With position -2.0, first 2 LEDs should be skipped
-                    # Remaining 3 LEDs should be rendered starting at position 0
-                    self.assertEqual(mock_add.call_count, 3)
-                    
-                    # Check that rendering started at index 0
-                    calls = mock_add.call_args_list
-                    first_call = calls[0]
-                    self.assertEqual(first_call[0][1], 0)  # First LED index should be 0
-        
+            with patch.object(ColorUtils, 'add_colors_to_led_array') as mock_add:
+                segment.render_to_led_array(self.sample_palette, time.perf_counter(), led_array)
+                
+                # With position -2.0, first 2 LEDs should be skipped
+                # Remaining 3 LEDs should be rendered starting at position 0
+                self.assertEqual(mock_add.call_count, 3)
+                
+                # Check that rendering started at index 0
+                calls = mock_add.call_args_list
+                first_call = calls[0]
+                self.assertEqual(first_call[0][1], 0)  # First LED index should be 0
+    
     def test_render_to_led_array_integer_position_truncation(self):
         """Test that fractional positions are truncated to integers (Phase 2)"""
         segment = Segment(
@@ -417,20 +414,19 @@ class TestSegment(unittest.TestCase):
         led_array = [[0, 0, 0] for _ in range(10)]
         
         with patch.object(segment, 'get_led_colors_with_timing', return_value=[[120, 60, 30], [120, 60, 30], [120, 60, 30]]):
-            with patch.object(ColorUtils, 'validate_rgb_color', side_effect=lambda x: x[:3]):
-                with patch.object(ColorUtils, 'add_colors_to_led_array') as mock_add:
-                    segment.render_to_led_array(self.sample_palette, time.time(), led_array)
-                    
-                    # Position 2.7 should be truncated to 2
-                    # All LEDs should have same color
-                    self.assertEqual(mock_add.call_count, 3)
-                    
-                    expected_calls = [
-                        unittest.mock.call(led_array, 2, [120, 60, 30]),  # position 2
-                        unittest.mock.call(led_array, 3, [120, 60, 30]),  # position 3
-                        unittest.mock.call(led_array, 4, [120, 60, 30])   # position 4
-                    ]
-                    mock_add.assert_has_calls(expected_calls)
+            with patch.object(ColorUtils, 'add_colors_to_led_array') as mock_add:
+                segment.render_to_led_array(self.sample_palette, time.perf_counter(), led_array)
+                
+                # Position 2.7 should be truncated to 2
+                # All LEDs should have same color
+                self.assertEqual(mock_add.call_count, 3)
+                
+                expected_calls = [
+                    unittest.mock.call(led_array, 2, [120, 60, 30]),  # position 2
+                    unittest.mock.call(led_array, 3, [120, 60, 30]),  # position 3
+                    unittest.mock.call(led_array, 4, [120, 60, 30])   # position 4
+                ]
+                mock_add.assert_has_calls(expected_calls)
 
     def test_update_position_integer_truncation(self):
         """Test that position updates use integer truncation"""
@@ -486,7 +482,25 @@ class TestSegment(unittest.TestCase):
         
         total = segment.get_total_led_count()
         self.assertEqual(total, 5)  # Only middle segment counts
-    
+
+    def test_summary(self):
+        """Test segment summary follows edits and expected LED count reduction"""
+        from src.models.effect import Effect
+
+        segment = Segment(segment_id=1, color=[0, 1], length=[4, 2])
+        self.assertEqual(segment.summary(), (6, True))
+
+        segment.length = [1, 1]
+        self.assertEqual(segment.summary(), (2, True))
+
+        hidden = Segment(segment_id=2, color=[-1, -1], length=[5, 5])
+        self.assertEqual(hidden.summary(), (10, False))
+
+        effect = Effect(effect_id=0)
+        effect.add_segment(segment)
+        effect.add_segment(hidden)
+        self.assertEqual(effect.get_expected_led_count(), 2)
+
     def test_to_dict_serialization(self):
         """Test segment serialization to dictionary"""
         segment = Segment(
@@ -539,6 +553,8 @@ class TestSegment(unittest.TestCase):
         self.assertEqual(segment.initial_position, 30)
         self.assertEqual(segment.is_edge_reflect, True)
         self.assertEqual(segment.dimmer_time, [[800, 0, 100], [200, 100, 0]])
+        self.assertIsNot(segment.dimmer_time, data["dimmer_time"])
+        self.assertIsNot(segment.dimmer_time[0], data["dimmer_time"][0])
     
     def test_from_dict_legacy_conversion(self):
         """Test segment creation with legacy format conversion"""
@@ -628,7 +644,7 @@ class TestSegment(unittest.TestCase):
         )
         
         with patch.object(segment, 'get_brightness_at_time', return_value=1.0):
-            colors = segment.get_led_colors_with_timing(self.sample_palette, time.time())
+            colors = segment.get_led_colors_with_timing(self.sample_palette, time.perf_counter())
             
             # With transparency=0.0, should get full color
             self.assertEqual(colors[0], [255, 0, 0])  # Full red
@@ -637,7 +653,7 @@ class TestSegment(unittest.TestCase):
         segment.transparency = [1.0]  # 1.0 = fully transparent
         
         with patch.object(segment, 'get_brightness_at_time', return_value=1.0):
-            colors = segment.get_led_colors_with_timing(self.sample_palette, time.time())
+            colors = segment.get_led_colors_with_timing(self.sample_palette, time.perf_counter())
             
             # With transparency=1.0, should get no color
             self.assertEqual(colors[0], [0, 0, 0])  # No color
@@ -667,13 +683,13 @@ class TestSegment(unittest.TestCase):
         
         # Should not crash with None palette
         try:
-            segment.render_to_led_array(None, time.time(), led_array)
+            segment.render_to_led_array(None, time.perf_counter(), led_array)
         except Exception as e:
             self.fail(f"render_to_led_array raised {e} unexpectedly!")
         
         # Should not crash with empty palette
         try:
-            segment.render_to_led_array([], time.time(), led_array)
+            segment.render_to_led_array([], time.perf_counter(), led_array)
         except Exception as e:
             self.fail(f"render_to_led_array raised {e} unexpectedly!")
 